@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Generate dashboard mockup images for Privé EDR/DLP platform."""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-from matplotlib.gridspec import GridSpec
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
+# matplotlib is imported lazily (see _get_figure) so importing this module,
+# or the pool's parent process, never pays for backend and style setup.
 COLORS = {
     'primary': '#667eea',
     'secondary': '#764ba2',
@@ -21,10 +22,116 @@ COLORS = {
     'text': '#f3f4f6'
 }
 
-def create_soc_dashboard():
+# Bucket colors from least to most severe, indexed with np.digitize
+SEVERITY_PALETTE = np.array([COLORS['low'], COLORS['medium'], COLORS['high'], COLORS['critical']])
+
+# Fixed x axes and seasonal curves of the synthetic time series; only the
+# noise is drawn per dashboard and added in place on top of these.
+_HOURS = np.arange(24)
+_EVENT_WAVE = np.sin(_HOURS * 0.25) * 2000
+_DAYS = np.arange(30)
+_VIOLATION_WAVE = np.sin(_DAYS * 0.2) * 15
+
+# Dark theme defaults, so individual axes only override what differs
+THEME_RCPARAMS = {
+    'axes.facecolor': COLORS['card'],
+    'axes.edgecolor': COLORS['text'],
+    'axes.labelcolor': COLORS['text'],
+    'text.color': COLORS['text'],
+    'xtick.color': COLORS['text'],
+    'ytick.color': COLORS['text'],
+    'grid.color': COLORS['text'],
+    'grid.alpha': 0.2,
+    'legend.facecolor': COLORS['card'],
+    'legend.edgecolor': COLORS['text'],
+}
+
+# Images are written next to this script
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Seed for the synthetic chart data. Each dashboard draws from its own
+# Generator so the images are reproducible whichever worker renders them.
+RNG_SEED = 42
+
+# The README embeds the PNGs; set DASHBOARD_FORMAT=svg to emit vector images,
+# which skips rasterization and PNG compression entirely.
+IMAGE_FORMAT = os.environ.get('DASHBOARD_FORMAT', 'png')
+
+# Figures are laid out at their final 16x10 size, so skip the extra
+# bbox_inches='tight' render pass and use fast zlib compression for the PNGs.
+if IMAGE_FORMAT == 'png':
+    SAVEFIG_KWARGS = {
+        'dpi': 150,
+        'facecolor': COLORS['bg'],
+        'pil_kwargs': {'compress_level': 1, 'optimize': False},
+    }
+else:
+    SAVEFIG_KWARGS = {'facecolor': COLORS['bg']}
+
+def _file_hash(path):
+    """Return the blake2b hex digest of the file at ``path``."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read()).hexdigest()
+
+# Every chart input is a literal in this file, so its hash identifies the output
+_SCRIPT_HASH = _file_hash(__file__)
+
+def _up_to_date(out):
+    """Return True if ``out`` was rendered by this script as it stands now.
+
+    The ``.stamp`` sidecar written by ``_save`` records the script hash and
+    the hash of the image it wrote. Mtimes are not trusted: a fresh checkout
+    gives script and images the same mtime, and generate_dashboards_pro.py
+    writes images under the same names.
+    """
+    try:
+        with open(out + '.stamp') as f:
+            stamp = f.read().split()
+    except OSError:
+        return False
+    return os.path.exists(out) and stamp == [_SCRIPT_HASH, _file_hash(out)]
+
+def _save(fig, out):
+    """Save a dashboard and stamp it as rendered by this script version."""
+    fig.savefig(out, **SAVEFIG_KWARGS)
+    with open(out + '.stamp', 'w') as f:
+        f.write(f"{_SCRIPT_HASH} {_file_hash(out)}\n")
+    print(f"✓ Generated: {os.path.basename(out)}")
+
+# Per-process Figure shared by every dashboard rendered in that process
+_FIGURE = None
+
+def _get_figure():
+    """Return the shared dashboard Figure, cleared for a new dashboard."""
+    global _FIGURE
+    if _FIGURE is None:
+        # Build the Figure on an Agg canvas directly; pyplot's figure
+        # manager and global state are never needed for batch rendering
+        import matplotlib
+        import matplotlib.style
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        matplotlib.style.use('seaborn-v0_8-darkgrid')
+        matplotlib.rcParams.update(THEME_RCPARAMS)
+        _FIGURE = Figure(figsize=(16, 10), facecolor=COLORS['bg'])
+        FigureCanvasAgg(_FIGURE)
+    else:
+        _FIGURE.clf()
+    return _FIGURE
+
+def create_soc_dashboard(out):
     """Create SOC Dashboard mockup."""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg'])
-    fig.suptitle('Privé - Security Operations Center', fontsize=20, color=COLORS['text'], weight='bold', y=0.98)
+    if _up_to_date(out):
+        print(f"- Up to date: {os.path.basename(out)}")
+        return
+    import matplotlib.patches as patches
+    from matplotlib.collections import PatchCollection
+    from matplotlib.gridspec import GridSpec
+
+    rng = np.random.default_rng(RNG_SEED)
+    fig = _get_figure()
+    fig.suptitle('Privé - Security Operations Center', fontsize=20, weight='bold', y=0.98)
 
     gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
 
@@ -32,78 +139,75 @@ def create_soc_dashboard():
     ax1 = fig.add_subplot(gs[0, 0])
     ax1.axis('off')
     ax1.add_patch(patches.Rectangle((0.1, 0.2), 0.8, 0.6, facecolor=COLORS['card'], edgecolor=COLORS['primary'], linewidth=2))
-    ax1.text(0.5, 0.7, '12,547', ha='center', va='center', fontsize=24, weight='bold', color=COLORS['text'])
-    ax1.text(0.5, 0.4, 'Events/Hour', ha='center', va='center', fontsize=12, color=COLORS['text'], alpha=0.7)
+    ax1.text(0.5, 0.7, '12,547', ha='center', va='center', fontsize=24, weight='bold')
+    ax1.text(0.5, 0.4, 'Events/Hour', ha='center', va='center', fontsize=12, alpha=0.7)
     ax1.text(0.5, 0.25, '▲ 15% from last hour', ha='center', va='center', fontsize=9, color=COLORS['low'])
 
     ax2 = fig.add_subplot(gs[0, 1])
     ax2.axis('off')
     ax2.add_patch(patches.Rectangle((0.1, 0.2), 0.8, 0.6, facecolor=COLORS['card'], edgecolor=COLORS['critical'], linewidth=2))
     ax2.text(0.5, 0.7, '23', ha='center', va='center', fontsize=24, weight='bold', color=COLORS['critical'])
-    ax2.text(0.5, 0.4, 'Critical Alerts', ha='center', va='center', fontsize=12, color=COLORS['text'], alpha=0.7)
+    ax2.text(0.5, 0.4, 'Critical Alerts', ha='center', va='center', fontsize=12, alpha=0.7)
     ax2.text(0.5, 0.25, '▼ 8 from yesterday', ha='center', va='center', fontsize=9, color=COLORS['low'])
 
     ax3 = fig.add_subplot(gs[0, 2])
     ax3.axis('off')
     ax3.add_patch(patches.Rectangle((0.1, 0.2), 0.8, 0.6, facecolor=COLORS['card'], edgecolor=COLORS['info'], linewidth=2))
-    ax3.text(0.5, 0.7, '1,247', ha='center', va='center', fontsize=24, weight='bold', color=COLORS['text'])
-    ax3.text(0.5, 0.4, 'Active Endpoints', ha='center', va='center', fontsize=12, color=COLORS['text'], alpha=0.7)
+    ax3.text(0.5, 0.7, '1,247', ha='center', va='center', fontsize=24, weight='bold')
+    ax3.text(0.5, 0.4, 'Active Endpoints', ha='center', va='center', fontsize=12, alpha=0.7)
     ax3.text(0.5, 0.25, '99.2% online', ha='center', va='center', fontsize=9, color=COLORS['low'])
 
     # Event timeline (middle left)
-    ax4 = fig.add_subplot(gs[1, :2], facecolor=COLORS['card'])
-    hours = np.arange(24)
-    events = np.random.poisson(10000, 24) + np.sin(hours / 4) * 2000
-    critical = np.random.poisson(20, 24)
+    ax4 = fig.add_subplot(gs[1, :2])
+    hours = _HOURS
+    events = rng.poisson(10000, 24).astype(float)
+    events += _EVENT_WAVE
+    critical = rng.poisson(20, 24)
 
     ax4.plot(hours, events, color=COLORS['primary'], linewidth=2, label='Total Events')
     ax4.fill_between(hours, events, alpha=0.3, color=COLORS['primary'])
     ax4_twin = ax4.twinx()
     ax4_twin.bar(hours, critical, alpha=0.6, color=COLORS['critical'], label='Critical', width=0.6)
 
-    ax4.set_title('24-Hour Event Timeline', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax4.set_xlabel('Hour', color=COLORS['text'])
-    ax4.set_ylabel('Total Events', color=COLORS['text'])
-    ax4_twin.set_ylabel('Critical Alerts', color=COLORS['text'])
-    ax4.tick_params(colors=COLORS['text'])
-    ax4_twin.tick_params(colors=COLORS['text'])
-    ax4.legend(loc='upper left', facecolor=COLORS['card'], edgecolor=COLORS['text'], labelcolor=COLORS['text'])
-    ax4_twin.legend(loc='upper right', facecolor=COLORS['card'], edgecolor=COLORS['text'], labelcolor=COLORS['text'])
-    ax4.grid(True, alpha=0.2, color=COLORS['text'])
+    ax4.set_title('24-Hour Event Timeline', fontsize=14, weight='bold', pad=10)
+    ax4.set_xlabel('Hour')
+    ax4.set_ylabel('Total Events')
+    ax4_twin.set_ylabel('Critical Alerts')
+    ax4.legend(loc='upper left')
+    ax4_twin.legend(loc='upper right')
+    ax4.grid(True)
 
     # MITRE ATT&CK heatmap (middle right)
-    ax5 = fig.add_subplot(gs[1, 2], facecolor=COLORS['card'])
+    ax5 = fig.add_subplot(gs[1, 2])
     tactics = ['Initial\nAccess', 'Execution', 'Persistence', 'Priv Esc', 'Defense\nEvasion', 'Credential\nAccess']
-    values = np.random.randint(0, 50, 6)
-    colors_heat = [COLORS['low'] if v < 10 else COLORS['medium'] if v < 25 else COLORS['high'] if v < 40 else COLORS['critical'] for v in values]
+    values = rng.integers(0, 50, 6)
+    colors_heat = SEVERITY_PALETTE[np.digitize(values, [10, 25, 40])]
 
     bars = ax5.barh(tactics, values, color=colors_heat, edgecolor='white', linewidth=1.5)
-    ax5.set_title('MITRE ATT&CK Coverage', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax5.set_xlabel('Detections (24h)', color=COLORS['text'])
-    ax5.tick_params(colors=COLORS['text'])
-    ax5.grid(True, alpha=0.2, color=COLORS['text'], axis='x')
+    ax5.set_title('MITRE ATT&CK Coverage', fontsize=14, weight='bold', pad=10)
+    ax5.set_xlabel('Detections (24h)')
+    ax5.grid(True, axis='x')
 
     # Add value labels
-    for i, (bar, value) in enumerate(zip(bars, values)):
-        ax5.text(value + 1, i, str(value), va='center', color=COLORS['text'], weight='bold')
+    ax5.bar_label(bars, padding=3, weight='bold')
 
     # Severity distribution (bottom left)
-    ax6 = fig.add_subplot(gs[2, 0], facecolor=COLORS['card'])
+    ax6 = fig.add_subplot(gs[2, 0])
     severities = ['Info', 'Low', 'Medium', 'High', 'Critical']
     counts = [5420, 1230, 450, 180, 23]
     colors_sev = [COLORS['info'], COLORS['low'], COLORS['medium'], COLORS['high'], COLORS['critical']]
 
     wedges, texts, autotexts = ax6.pie(counts, labels=severities, autopct='%1.1f%%',
-                                        colors=colors_sev, startangle=90, textprops={'color': COLORS['text']})
+                                        colors=colors_sev, startangle=90)
     for autotext in autotexts:
         autotext.set_color('white')
         autotext.set_weight('bold')
-    ax6.set_title('Severity Distribution', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
+    ax6.set_title('Severity Distribution', fontsize=14, weight='bold', pad=10)
 
     # Top affected endpoints (bottom middle)
-    ax7 = fig.add_subplot(gs[2, 1], facecolor=COLORS['card'])
+    ax7 = fig.add_subplot(gs[2, 1])
     ax7.axis('off')
-    ax7.text(0.5, 0.95, 'Top Affected Endpoints', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax7.text(0.5, 0.95, 'Top Affected Endpoints', ha='center', va='top', fontsize=14, weight='bold')
 
     endpoints = [
         ('WKS-Finance-042', 347, COLORS['critical']),
@@ -113,17 +217,19 @@ def create_soc_dashboard():
         ('WKS-Dev-087', 98, COLORS['low'])
     ]
 
+    rows = []
     y_pos = 0.78
     for name, count, color in endpoints:
-        ax7.add_patch(patches.Rectangle((0.05, y_pos - 0.08), 0.9, 0.12, facecolor=COLORS['card'], edgecolor=color, linewidth=2))
-        ax7.text(0.08, y_pos - 0.02, name, va='center', fontsize=10, color=COLORS['text'], weight='bold')
+        rows.append(patches.Rectangle((0.05, y_pos - 0.08), 0.9, 0.12))
+        ax7.text(0.08, y_pos - 0.02, name, va='center', fontsize=10, weight='bold')
         ax7.text(0.92, y_pos - 0.02, str(count), ha='right', va='center', fontsize=11, color=color, weight='bold')
         y_pos -= 0.15
+    ax7.add_collection(PatchCollection(rows, facecolors=COLORS['card'], edgecolors=[c for _, _, c in endpoints], linewidths=2), autolim=False)
 
     # Recent critical alerts (bottom right)
-    ax8 = fig.add_subplot(gs[2, 2], facecolor=COLORS['card'])
+    ax8 = fig.add_subplot(gs[2, 2])
     ax8.axis('off')
-    ax8.text(0.5, 0.95, 'Recent Critical Alerts', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax8.text(0.5, 0.95, 'Recent Critical Alerts', ha='center', va='top', fontsize=14, weight='bold')
 
     alerts = [
         ('Ransomware Activity', '2m ago'),
@@ -136,22 +242,28 @@ def create_soc_dashboard():
     y_pos = 0.78
     for alert, time in alerts:
         ax8.text(0.05, y_pos, f'● {alert}', va='center', fontsize=9, color=COLORS['critical'], weight='bold')
-        ax8.text(0.95, y_pos, time, ha='right', va='center', fontsize=8, color=COLORS['text'], alpha=0.6)
+        ax8.text(0.95, y_pos, time, ha='right', va='center', fontsize=8, alpha=0.6)
         y_pos -= 0.15
 
-    plt.savefig('/home/user/EDR_Prive/docs/images/dashboard-soc.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg'])
-    print("✓ Generated: dashboard-soc.png")
-    plt.close()
+    _save(fig, out)
 
-def create_hunting_dashboard():
+def create_hunting_dashboard(out):
     """Create Threat Hunting Dashboard mockup."""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg'])
-    fig.suptitle('Privé - Threat Hunting Workbench', fontsize=20, color=COLORS['text'], weight='bold', y=0.98)
+    if _up_to_date(out):
+        print(f"- Up to date: {os.path.basename(out)}")
+        return
+    import matplotlib.patches as patches
+    from matplotlib.collections import PatchCollection
+    from matplotlib.gridspec import GridSpec
+
+    rng = np.random.default_rng(RNG_SEED)
+    fig = _get_figure()
+    fig.suptitle('Privé - Threat Hunting Workbench', fontsize=20, weight='bold', y=0.98)
 
     gs = GridSpec(3, 2, figure=fig, hspace=0.3, wspace=0.3)
 
     # Query builder (top)
-    ax1 = fig.add_subplot(gs[0, :], facecolor=COLORS['card'])
+    ax1 = fig.add_subplot(gs[0, :])
     ax1.axis('off')
     ax1.add_patch(patches.Rectangle((0.02, 0.15), 0.96, 0.7, facecolor='#2d3748', edgecolor=COLORS['primary'], linewidth=2, alpha=0.5))
     ax1.text(0.03, 0.72, 'SELECT * FROM telemetry_events WHERE event_type = \'PROCESS_START\'',
@@ -166,12 +278,12 @@ def create_hunting_dashboard():
     ax1.add_patch(patches.Rectangle((0.82, 0.20), 0.15, 0.15, facecolor=COLORS['primary'], edgecolor='white', linewidth=1))
     ax1.text(0.895, 0.275, 'RUN QUERY', ha='center', va='center', fontsize=10, color='white', weight='bold')
 
-    ax1.text(0.5, 0.92, 'Advanced Threat Hunt Query Builder', ha='center', va='center', fontsize=14, weight='bold', color=COLORS['text'])
+    ax1.text(0.5, 0.92, 'Advanced Threat Hunt Query Builder', ha='center', va='center', fontsize=14, weight='bold')
 
     # Process tree visualization (middle left)
-    ax2 = fig.add_subplot(gs[1, 0], facecolor=COLORS['card'])
+    ax2 = fig.add_subplot(gs[1, 0])
     ax2.axis('off')
-    ax2.text(0.5, 0.95, 'Process Execution Tree', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax2.text(0.5, 0.95, 'Process Execution Tree', ha='center', va='top', fontsize=14, weight='bold')
 
     # Draw tree structure
     processes = [
@@ -186,32 +298,22 @@ def create_hunting_dashboard():
         ax2.text(x, y, text, va='center', fontsize=10, color=color, family='monospace', weight='bold')
 
     # Timeline (middle right)
-    ax3 = fig.add_subplot(gs[1, 1], facecolor=COLORS['card'])
+    ax3 = fig.add_subplot(gs[1, 1])
     times = np.arange(0, 60, 5)
-    events_timeline = np.random.randint(10, 100, len(times))
-
-    colors_timeline = []
-    for e in events_timeline:
-        if e > 70:
-            colors_timeline.append(COLORS['critical'])
-        elif e > 50:
-            colors_timeline.append(COLORS['high'])
-        elif e > 30:
-            colors_timeline.append(COLORS['medium'])
-        else:
-            colors_timeline.append(COLORS['low'])
+    events_timeline = rng.integers(10, 100, len(times))
+
+    colors_timeline = SEVERITY_PALETTE[np.digitize(events_timeline, [30, 50, 70], right=True)]
 
     ax3.bar(times, events_timeline, color=colors_timeline, width=4, edgecolor='white', linewidth=0.5)
-    ax3.set_title('Event Timeline (Last Hour)', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax3.set_xlabel('Minutes Ago', color=COLORS['text'])
-    ax3.set_ylabel('Event Count', color=COLORS['text'])
-    ax3.tick_params(colors=COLORS['text'])
-    ax3.grid(True, alpha=0.2, color=COLORS['text'])
+    ax3.set_title('Event Timeline (Last Hour)', fontsize=14, weight='bold', pad=10)
+    ax3.set_xlabel('Minutes Ago')
+    ax3.set_ylabel('Event Count')
+    ax3.grid(True)
 
     # IOC Correlation (bottom left)
-    ax4 = fig.add_subplot(gs[2, 0], facecolor=COLORS['card'])
+    ax4 = fig.add_subplot(gs[2, 0])
     ax4.axis('off')
-    ax4.text(0.5, 0.95, 'IOC Correlation Matrix', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax4.text(0.5, 0.95, 'IOC Correlation Matrix', ha='center', va='top', fontsize=14, weight='bold')
 
     iocs = [
         ('Suspicious IP: 192.0.2.45', 'T1071 - C2', 12, COLORS['critical']),
@@ -220,19 +322,23 @@ def create_hunting_dashboard():
         ('Registry Key: HKLM\\...', 'T1547 - Persistence', 3, COLORS['low'])
     ]
 
+    rows, badges = [], []
     y_pos = 0.78
     for ioc, technique, count, color in iocs:
-        ax4.add_patch(patches.Rectangle((0.05, y_pos - 0.10), 0.9, 0.15, facecolor=COLORS['card'], edgecolor=color, linewidth=2))
-        ax4.text(0.08, y_pos - 0.02, ioc, va='center', fontsize=10, color=COLORS['text'], weight='bold')
-        ax4.text(0.08, y_pos - 0.06, technique, va='center', fontsize=8, color=COLORS['text'], alpha=0.6)
-        ax4.add_patch(patches.Circle((0.88, y_pos - 0.04), 0.03, facecolor=color, edgecolor='white', linewidth=1))
+        rows.append(patches.Rectangle((0.05, y_pos - 0.10), 0.9, 0.15))
+        ax4.text(0.08, y_pos - 0.02, ioc, va='center', fontsize=10, weight='bold')
+        ax4.text(0.08, y_pos - 0.06, technique, va='center', fontsize=8, alpha=0.6)
+        badges.append(patches.Circle((0.88, y_pos - 0.04), 0.03))
         ax4.text(0.88, y_pos - 0.04, str(count), ha='center', va='center', fontsize=9, color='white', weight='bold')
         y_pos -= 0.20
+    ioc_colors = [c for _, _, _, c in iocs]
+    ax4.add_collection(PatchCollection(rows, facecolors=COLORS['card'], edgecolors=ioc_colors, linewidths=2), autolim=False)
+    ax4.add_collection(PatchCollection(badges, facecolors=ioc_colors, edgecolors='white', linewidths=1), autolim=False)
 
     # Query results table (bottom right)
-    ax5 = fig.add_subplot(gs[2, 1], facecolor=COLORS['card'])
+    ax5 = fig.add_subplot(gs[2, 1])
     ax5.axis('off')
-    ax5.text(0.5, 0.95, 'Query Results (Top 5)', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax5.text(0.5, 0.95, 'Query Results (Top 5)', ha='center', va='top', fontsize=14, weight='bold')
 
     # Table header
     ax5.add_patch(patches.Rectangle((0.05, 0.82), 0.9, 0.08, facecolor=COLORS['primary'], edgecolor='white', linewidth=1))
@@ -250,21 +356,31 @@ def create_hunting_dashboard():
     ]
 
     y_pos = 0.74
+    rows, badges = [], []
     for time, event, color in results:
-        ax5.add_patch(patches.Rectangle((0.05, y_pos - 0.05), 0.9, 0.08, facecolor='#2d3748', edgecolor=color, linewidth=1, alpha=0.3))
-        ax5.text(0.08, y_pos - 0.01, time, va='center', fontsize=9, color=COLORS['text'], family='monospace')
-        ax5.text(0.40, y_pos - 0.01, event, va='center', fontsize=9, color=COLORS['text'])
-        ax5.add_patch(patches.Circle((0.85, y_pos - 0.01), 0.015, facecolor=color, edgecolor='white', linewidth=1))
+        rows.append(patches.Rectangle((0.05, y_pos - 0.05), 0.9, 0.08))
+        ax5.text(0.08, y_pos - 0.01, time, va='center', fontsize=9, family='monospace')
+        ax5.text(0.40, y_pos - 0.01, event, va='center', fontsize=9)
+        badges.append(patches.Circle((0.85, y_pos - 0.01), 0.015))
         y_pos -= 0.12
+    result_colors = [c for _, _, c in results]
+    ax5.add_collection(PatchCollection(rows, facecolors='#2d3748', edgecolors=result_colors, linewidths=1, alpha=0.3), autolim=False)
+    ax5.add_collection(PatchCollection(badges, facecolors=result_colors, edgecolors='white', linewidths=1), autolim=False)
 
-    plt.savefig('/home/user/EDR_Prive/docs/images/dashboard-hunting.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg'])
-    print("✓ Generated: dashboard-hunting.png")
-    plt.close()
+    _save(fig, out)
 
-def create_dlp_dashboard():
+def create_dlp_dashboard(out):
     """Create DLP Dashboard mockup."""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg'])
-    fig.suptitle('Privé - Data Loss Prevention Management', fontsize=20, color=COLORS['text'], weight='bold', y=0.98)
+    if _up_to_date(out):
+        print(f"- Up to date: {os.path.basename(out)}")
+        return
+    import matplotlib.patches as patches
+    from matplotlib.collections import PatchCollection
+    from matplotlib.gridspec import GridSpec
+
+    rng = np.random.default_rng(RNG_SEED)
+    fig = _get_figure()
+    fig.suptitle('Privé - Data Loss Prevention Management', fontsize=20, weight='bold', y=0.98)
 
     gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
 
@@ -273,72 +389,71 @@ def create_dlp_dashboard():
     ax1.axis('off')
     ax1.add_patch(patches.Rectangle((0.1, 0.2), 0.8, 0.6, facecolor=COLORS['card'], edgecolor=COLORS['critical'], linewidth=2))
     ax1.text(0.5, 0.7, '47', ha='center', va='center', fontsize=24, weight='bold', color=COLORS['critical'])
-    ax1.text(0.5, 0.4, 'DLP Violations', ha='center', va='center', fontsize=12, color=COLORS['text'], alpha=0.7)
-    ax1.text(0.5, 0.25, 'Last 24 hours', ha='center', va='center', fontsize=9, color=COLORS['text'], alpha=0.5)
+    ax1.text(0.5, 0.4, 'DLP Violations', ha='center', va='center', fontsize=12, alpha=0.7)
+    ax1.text(0.5, 0.25, 'Last 24 hours', ha='center', va='center', fontsize=9, alpha=0.5)
 
     ax2 = fig.add_subplot(gs[0, 1])
     ax2.axis('off')
     ax2.add_patch(patches.Rectangle((0.1, 0.2), 0.8, 0.6, facecolor=COLORS['card'], edgecolor=COLORS['info'], linewidth=2))
-    ax2.text(0.5, 0.7, '1.2TB', ha='center', va='center', fontsize=24, weight='bold', color=COLORS['text'])
-    ax2.text(0.5, 0.4, 'Data Scanned', ha='center', va='center', fontsize=12, color=COLORS['text'], alpha=0.7)
+    ax2.text(0.5, 0.7, '1.2TB', ha='center', va='center', fontsize=24, weight='bold')
+    ax2.text(0.5, 0.4, 'Data Scanned', ha='center', va='center', fontsize=12, alpha=0.7)
     ax2.text(0.5, 0.25, '▲ 18% vs. last week', ha='center', va='center', fontsize=9, color=COLORS['low'])
 
     ax3 = fig.add_subplot(gs[0, 2])
     ax3.axis('off')
     ax3.add_patch(patches.Rectangle((0.1, 0.2), 0.8, 0.6, facecolor=COLORS['card'], edgecolor=COLORS['high'], linewidth=2))
     ax3.text(0.5, 0.7, '89', ha='center', va='center', fontsize=24, weight='bold', color=COLORS['high'])
-    ax3.text(0.5, 0.4, 'Active Policies', ha='center', va='center', fontsize=12, color=COLORS['text'], alpha=0.7)
+    ax3.text(0.5, 0.4, 'Active Policies', ha='center', va='center', fontsize=12, alpha=0.7)
     ax3.text(0.5, 0.25, '12 modified today', ha='center', va='center', fontsize=9, color=COLORS['info'])
 
     # Violation trend (middle left/center)
-    ax4 = fig.add_subplot(gs[1, :2], facecolor=COLORS['card'])
-    days = np.arange(30)
-    violations = np.random.poisson(40, 30) + np.sin(days / 5) * 15
-    blocked = violations * 0.7 + np.random.randint(-5, 5, 30)
+    ax4 = fig.add_subplot(gs[1, :2])
+    days = _DAYS
+    violations = rng.poisson(40, 30).astype(float)
+    violations += _VIOLATION_WAVE
+    blocked = violations * 0.7
+    blocked += rng.integers(-5, 5, 30)
 
     ax4.plot(days, violations, color=COLORS['critical'], linewidth=2, marker='o', markersize=4, label='Total Violations')
     ax4.plot(days, blocked, color=COLORS['low'], linewidth=2, marker='s', markersize=4, label='Blocked')
     ax4.fill_between(days, blocked, alpha=0.3, color=COLORS['low'])
 
-    ax4.set_title('DLP Violation Trend (30 Days)', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax4.set_xlabel('Days Ago', color=COLORS['text'])
-    ax4.set_ylabel('Violations', color=COLORS['text'])
-    ax4.tick_params(colors=COLORS['text'])
-    ax4.legend(loc='upper left', facecolor=COLORS['card'], edgecolor=COLORS['text'], labelcolor=COLORS['text'])
-    ax4.grid(True, alpha=0.2, color=COLORS['text'])
+    ax4.set_title('DLP Violation Trend (30 Days)', fontsize=14, weight='bold', pad=10)
+    ax4.set_xlabel('Days Ago')
+    ax4.set_ylabel('Violations')
+    ax4.legend(loc='upper left')
+    ax4.grid(True)
 
     # Top violated policies (middle right)
-    ax5 = fig.add_subplot(gs[1, 2], facecolor=COLORS['card'])
+    ax5 = fig.add_subplot(gs[1, 2])
     policies = ['SSN-US', 'CCN-All', 'HIPAA-PHI', 'PII-Email', 'Source\nCode']
     counts = [18, 12, 9, 5, 3]
 
     bars = ax5.barh(policies, counts, color=COLORS['critical'], edgecolor='white', linewidth=1.5)
-    ax5.set_title('Top Violated Policies', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax5.set_xlabel('Violations (24h)', color=COLORS['text'])
-    ax5.tick_params(colors=COLORS['text'])
-    ax5.grid(True, alpha=0.2, color=COLORS['text'], axis='x')
+    ax5.set_title('Top Violated Policies', fontsize=14, weight='bold', pad=10)
+    ax5.set_xlabel('Violations (24h)')
+    ax5.grid(True, axis='x')
 
-    for i, (bar, count) in enumerate(zip(bars, counts)):
-        ax5.text(count + 0.3, i, str(count), va='center', color=COLORS['text'], weight='bold')
+    ax5.bar_label(bars, padding=3, weight='bold')
 
     # Data classification (bottom left)
-    ax6 = fig.add_subplot(gs[2, 0], facecolor=COLORS['card'])
+    ax6 = fig.add_subplot(gs[2, 0])
     classifications = ['Public', 'Internal', 'Confidential', 'Restricted', 'Top Secret']
     data_counts = [45, 30, 15, 7, 3]
     colors_class = [COLORS['low'], COLORS['info'], COLORS['medium'], COLORS['high'], COLORS['critical']]
 
     wedges, texts, autotexts = ax6.pie(data_counts, labels=classifications, autopct='%1.1f%%',
-                                        colors=colors_class, startangle=90, textprops={'color': COLORS['text']})
+                                        colors=colors_class, startangle=90)
     for autotext in autotexts:
         autotext.set_color('white')
         autotext.set_weight('bold')
         autotext.set_fontsize(9)
-    ax6.set_title('Data Classification', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
+    ax6.set_title('Data Classification', fontsize=14, weight='bold', pad=10)
 
     # Recent violations (bottom middle)
-    ax7 = fig.add_subplot(gs[2, 1], facecolor=COLORS['card'])
+    ax7 = fig.add_subplot(gs[2, 1])
     ax7.axis('off')
-    ax7.text(0.5, 0.95, 'Recent Violations', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax7.text(0.5, 0.95, 'Recent Violations', ha='center', va='top', fontsize=14, weight='bold')
 
     violations_list = [
         ('SSN detected in email', 'john.doe@...', '2m ago', COLORS['critical']),
@@ -348,67 +463,69 @@ def create_dlp_dashboard():
         ('Customer list export', 'customers.csv', '18m ago', COLORS['high'])
     ]
 
+    rows = []
     y_pos = 0.80
     for violation, location, time, color in violations_list:
-        ax7.add_patch(patches.Rectangle((0.03, y_pos - 0.08), 0.94, 0.12, facecolor=COLORS['card'], edgecolor=color, linewidth=2))
-        ax7.text(0.05, y_pos - 0.02, violation, va='center', fontsize=9, color=COLORS['text'], weight='bold')
-        ax7.text(0.05, y_pos - 0.06, location, va='center', fontsize=8, color=COLORS['text'], alpha=0.6, style='italic')
+        rows.append(patches.Rectangle((0.03, y_pos - 0.08), 0.94, 0.12))
+        ax7.text(0.05, y_pos - 0.02, violation, va='center', fontsize=9, weight='bold')
+        ax7.text(0.05, y_pos - 0.06, location, va='center', fontsize=8, alpha=0.6, style='italic')
         ax7.text(0.95, y_pos - 0.04, time, ha='right', va='center', fontsize=8, color=color)
         y_pos -= 0.16
+    ax7.add_collection(PatchCollection(rows, facecolors=COLORS['card'], edgecolors=[c for _, _, _, c in violations_list], linewidths=2), autolim=False)
 
     # Policy effectiveness (bottom right)
-    ax8 = fig.add_subplot(gs[2, 2], facecolor=COLORS['card'])
+    ax8 = fig.add_subplot(gs[2, 2])
     policy_types = ['Detection', 'Block', 'Encrypt', 'Alert', 'Audit']
     effectiveness = [95, 88, 92, 97, 100]
-    colors_eff = [COLORS['low'] if e > 90 else COLORS['medium'] if e > 75 else COLORS['high'] for e in effectiveness]
+    colors_eff = SEVERITY_PALETTE[2::-1][np.digitize(effectiveness, [75, 90], right=True)]
 
     bars = ax8.bar(policy_types, effectiveness, color=colors_eff, edgecolor='white', linewidth=1.5)
-    ax8.set_title('Policy Effectiveness', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax8.set_ylabel('Success Rate (%)', color=COLORS['text'])
-    ax8.tick_params(colors=COLORS['text'])
+    ax8.set_title('Policy Effectiveness', fontsize=14, weight='bold', pad=10)
+    ax8.set_ylabel('Success Rate (%)')
     ax8.set_ylim(0, 100)
-    ax8.grid(True, alpha=0.2, color=COLORS['text'], axis='y')
+    ax8.grid(True, axis='y')
     ax8.axhline(y=90, color=COLORS['low'], linestyle='--', alpha=0.5, linewidth=1)
 
-    for bar, value in zip(bars, effectiveness):
-        ax8.text(bar.get_x() + bar.get_width() / 2, value + 2, f'{value}%',
-                ha='center', va='bottom', color=COLORS['text'], weight='bold', fontsize=9)
+    ax8.bar_label(bars, fmt='%d%%', padding=3, weight='bold', fontsize=9)
 
-    plt.savefig('/home/user/EDR_Prive/docs/images/dashboard-dlp.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg'])
-    print("✓ Generated: dashboard-dlp.png")
-    plt.close()
+    _save(fig, out)
 
-def create_executive_dashboard():
+def create_executive_dashboard(out):
     """Create Executive Dashboard mockup."""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg'])
-    fig.suptitle('Privé - Executive Security Dashboard', fontsize=20, color=COLORS['text'], weight='bold', y=0.98)
+    if _up_to_date(out):
+        print(f"- Up to date: {os.path.basename(out)}")
+        return
+    import matplotlib.patches as patches
+    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.gridspec import GridSpec
+
+    fig = _get_figure()
+    fig.suptitle('Privé - Executive Security Dashboard', fontsize=20, weight='bold', y=0.98)
 
     gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
 
     # Security score (top left, larger)
-    ax1 = fig.add_subplot(gs[0:2, 0], facecolor=COLORS['card'])
+    ax1 = fig.add_subplot(gs[0:2, 0])
     ax1.axis('off')
 
-    # Draw circular progress
-    theta = np.linspace(0, 2 * np.pi * 0.87, 100)
+    # Draw circular progress (87% arc) under a translucent background circle
+    # as a single LineCollection. Each ring keeps its own 100 samples, since
+    # slicing the arc from the full circle shifts its vertices visibly.
     r = 0.35
-    x = 0.5 + r * np.cos(theta - np.pi / 2)
-    y = 0.5 + r * np.sin(theta - np.pi / 2)
-    ax1.plot(x, y, color=COLORS['low'], linewidth=15)
-
-    # Background circle
-    theta_bg = np.linspace(0, 2 * np.pi, 100)
-    x_bg = 0.5 + r * np.cos(theta_bg - np.pi / 2)
-    y_bg = 0.5 + r * np.sin(theta_bg - np.pi / 2)
-    ax1.plot(x_bg, y_bg, color='#4b5563', linewidth=15, alpha=0.3)
+    theta = np.linspace(0, 2 * np.pi * np.array([0.87, 1]), 100, axis=1) - np.pi / 2
+    rings = np.stack((0.5 + r * np.cos(theta), 0.5 + r * np.sin(theta)), axis=-1)
+    # Round caps, as the seaborn style gives the plotted lines this replaced
+    ax1.add_collection(LineCollection(rings, colors=[COLORS['low'], to_rgba('#4b5563', 0.3)],
+                                      linewidths=15, capstyle='round'))
 
     ax1.text(0.5, 0.55, '87', ha='center', va='center', fontsize=48, weight='bold', color=COLORS['low'])
-    ax1.text(0.5, 0.40, 'Security Score', ha='center', va='center', fontsize=14, color=COLORS['text'])
+    ax1.text(0.5, 0.40, 'Security Score', ha='center', va='center', fontsize=14)
     ax1.text(0.5, 0.32, '▲ 5 points this month', ha='center', va='center', fontsize=10, color=COLORS['low'])
-    ax1.text(0.5, 0.95, 'Overall Posture', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax1.text(0.5, 0.95, 'Overall Posture', ha='center', va='top', fontsize=14, weight='bold')
 
     # Risk trend (top middle/right)
-    ax2 = fig.add_subplot(gs[0, 1:], facecolor=COLORS['card'])
+    ax2 = fig.add_subplot(gs[0, 1:])
     months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
     critical_risk = [45, 38, 32, 28, 25, 23]
     high_risk = [120, 105, 95, 88, 82, 78]
@@ -418,16 +535,15 @@ def create_executive_dashboard():
     ax2.plot(months, high_risk, color=COLORS['high'], linewidth=3, marker='s', markersize=8, label='High')
     ax2.plot(months, medium_risk, color=COLORS['medium'], linewidth=3, marker='^', markersize=8, label='Medium')
 
-    ax2.set_title('Risk Reduction Trend', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax2.set_ylabel('Open Risks', color=COLORS['text'])
-    ax2.tick_params(colors=COLORS['text'])
-    ax2.legend(loc='upper right', facecolor=COLORS['card'], edgecolor=COLORS['text'], labelcolor=COLORS['text'])
-    ax2.grid(True, alpha=0.2, color=COLORS['text'])
+    ax2.set_title('Risk Reduction Trend', fontsize=14, weight='bold', pad=10)
+    ax2.set_ylabel('Open Risks')
+    ax2.legend(loc='upper right')
+    ax2.grid(True)
 
     # Compliance status (middle middle/right)
-    ax3 = fig.add_subplot(gs[1, 1:], facecolor=COLORS['card'])
+    ax3 = fig.add_subplot(gs[1, 1:])
     ax3.axis('off')
-    ax3.text(0.5, 0.95, 'Compliance Framework Status', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax3.text(0.5, 0.95, 'Compliance Framework Status', ha='center', va='top', fontsize=14, weight='bold')
 
     compliance = [
         ('GDPR', 98, COLORS['low']),
@@ -437,37 +553,37 @@ def create_executive_dashboard():
         ('PCI DSS', 91, COLORS['low'])
     ]
 
+    tracks, progress = [], []
     y_pos = 0.80
     for framework, score, color in compliance:
         # Background bar
-        ax3.add_patch(patches.Rectangle((0.25, y_pos - 0.05), 0.65, 0.08, facecolor='#4b5563', alpha=0.3))
+        tracks.append(patches.Rectangle((0.25, y_pos - 0.05), 0.65, 0.08))
         # Progress bar
-        ax3.add_patch(patches.Rectangle((0.25, y_pos - 0.05), 0.65 * (score / 100), 0.08, facecolor=color))
+        progress.append(patches.Rectangle((0.25, y_pos - 0.05), 0.65 * (score / 100), 0.08))
         # Labels
-        ax3.text(0.05, y_pos - 0.01, framework, va='center', fontsize=11, color=COLORS['text'], weight='bold')
+        ax3.text(0.05, y_pos - 0.01, framework, va='center', fontsize=11, weight='bold')
         ax3.text(0.93, y_pos - 0.01, f'{score}%', ha='right', va='center', fontsize=11, color=color, weight='bold')
         y_pos -= 0.16
+    ax3.add_collection(PatchCollection(tracks, facecolors='#4b5563', edgecolors='none', alpha=0.3), autolim=False)
+    ax3.add_collection(PatchCollection(progress, facecolors=[c for _, _, c in compliance], edgecolors='none'), autolim=False)
 
     # Monthly threat summary (bottom left)
-    ax4 = fig.add_subplot(gs[2, 0], facecolor=COLORS['card'])
+    ax4 = fig.add_subplot(gs[2, 0])
     categories = ['Malware', 'Phishing', 'Intrusion', 'DLP', 'Insider']
     incidents = [12, 28, 5, 47, 8]
     colors_cat = [COLORS['critical'], COLORS['high'], COLORS['medium'], COLORS['high'], COLORS['medium']]
 
     bars = ax4.bar(categories, incidents, color=colors_cat, edgecolor='white', linewidth=1.5)
-    ax4.set_title('Incidents by Category', color=COLORS['text'], fontsize=14, weight='bold', pad=10)
-    ax4.set_ylabel('Count (Last 30 Days)', color=COLORS['text'])
-    ax4.tick_params(colors=COLORS['text'])
-    ax4.grid(True, alpha=0.2, color=COLORS['text'], axis='y')
+    ax4.set_title('Incidents by Category', fontsize=14, weight='bold', pad=10)
+    ax4.set_ylabel('Count (Last 30 Days)')
+    ax4.grid(True, axis='y')
 
-    for bar, count in zip(bars, incidents):
-        ax4.text(bar.get_x() + bar.get_width() / 2, count + 1, str(count),
-                ha='center', va='bottom', color=COLORS['text'], weight='bold', fontsize=10)
+    ax4.bar_label(bars, padding=3, weight='bold', fontsize=10)
 
     # Mean time to respond (bottom middle)
-    ax5 = fig.add_subplot(gs[2, 1], facecolor=COLORS['card'])
+    ax5 = fig.add_subplot(gs[2, 1])
     ax5.axis('off')
-    ax5.text(0.5, 0.95, 'Response Metrics', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax5.text(0.5, 0.95, 'Response Metrics', ha='center', va='top', fontsize=14, weight='bold')
 
     metrics = [
         ('Mean Time to Detect', '4.2', 'minutes', COLORS['low']),
@@ -476,18 +592,20 @@ def create_executive_dashboard():
         ('Mean Time to Recover', '2.1', 'hours', COLORS['medium'])
     ]
 
+    rows = []
     y_pos = 0.78
     for label, value, unit, color in metrics:
-        ax5.add_patch(patches.Rectangle((0.05, y_pos - 0.08), 0.9, 0.12, facecolor=COLORS['card'], edgecolor=color, linewidth=2))
-        ax5.text(0.08, y_pos - 0.02, label, va='center', fontsize=10, color=COLORS['text'])
+        rows.append(patches.Rectangle((0.05, y_pos - 0.08), 0.9, 0.12))
+        ax5.text(0.08, y_pos - 0.02, label, va='center', fontsize=10)
         ax5.text(0.85, y_pos - 0.02, value, ha='right', va='center', fontsize=12, color=color, weight='bold')
-        ax5.text(0.92, y_pos - 0.02, unit, ha='right', va='center', fontsize=8, color=COLORS['text'], alpha=0.6)
+        ax5.text(0.92, y_pos - 0.02, unit, ha='right', va='center', fontsize=8, alpha=0.6)
         y_pos -= 0.20
+    ax5.add_collection(PatchCollection(rows, facecolors=COLORS['card'], edgecolors=[c for _, _, _, c in metrics], linewidths=2), autolim=False)
 
     # Cost savings (bottom right)
-    ax6 = fig.add_subplot(gs[2, 2], facecolor=COLORS['card'])
+    ax6 = fig.add_subplot(gs[2, 2])
     ax6.axis('off')
-    ax6.text(0.5, 0.95, 'Security ROI', ha='center', va='top', fontsize=14, weight='bold', color=COLORS['text'])
+    ax6.text(0.5, 0.95, 'Security ROI', ha='center', va='top', fontsize=14, weight='bold')
 
     ax6.add_patch(patches.Rectangle((0.1, 0.50), 0.8, 0.30, facecolor=COLORS['primary'], edgecolor='white', linewidth=2))
     ax6.text(0.5, 0.68, '$2.4M', ha='center', va='center', fontsize=24, weight='bold', color='white')
@@ -495,18 +613,26 @@ def create_executive_dashboard():
 
     ax6.add_patch(patches.Rectangle((0.1, 0.15), 0.8, 0.25, facecolor=COLORS['card'], edgecolor=COLORS['low'], linewidth=2))
     ax6.text(0.5, 0.32, '47', ha='center', va='center', fontsize=20, weight='bold', color=COLORS['low'])
-    ax6.text(0.5, 0.22, 'Incidents Blocked', ha='center', va='center', fontsize=10, color=COLORS['text'])
+    ax6.text(0.5, 0.22, 'Incidents Blocked', ha='center', va='center', fontsize=10)
+
+    _save(fig, out)
+
+DASHBOARDS = {
+    'soc': create_soc_dashboard,
+    'hunting': create_hunting_dashboard,
+    'dlp': create_dlp_dashboard,
+    'executive': create_executive_dashboard,
+}
 
-    plt.savefig('/home/user/EDR_Prive/docs/images/dashboard-executive.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg'])
-    print("✓ Generated: dashboard-executive.png")
-    plt.close()
+def _run(name):
+    """Render a single dashboard; runs in a worker process."""
+    DASHBOARDS[name](os.path.join(OUTPUT_DIR, f'dashboard-{name}.{IMAGE_FORMAT}'))
 
 if __name__ == '__main__':
     print("Generating Privé dashboard mockups...")
     print()
-    create_soc_dashboard()
-    create_hunting_dashboard()
-    create_dlp_dashboard()
-    create_executive_dashboard()
+    # Dashboards share no state, so each can render in its own worker
+    with ProcessPoolExecutor(max_workers=len(DASHBOARDS)) as executor:
+        list(executor.map(_run, DASHBOARDS))
     print()
     print("✓ All dashboard images generated successfully!")
@@ -4,11 +4,18 @@ Professional Dashboard Mockup Generator for Privé EDR/DLP Platform
 Generates high-quality, attractive dashboard images for marketing
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Render straight to files; no GUI backend needed
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, Circle, Rectangle
+from matplotlib.patches import FancyBboxPatch, Circle, PathPatch, Rectangle, Wedge
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.transforms import BboxTransformTo, offset_copy
 import numpy as np
 from datetime import datetime, timedelta
+import multiprocessing
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -34,41 +41,58 @@ COLORS = {
 
 # Set global style
 plt.style.use('dark_background')
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
-plt.rcParams['font.size'] = 9
-plt.rcParams['axes.facecolor'] = COLORS['bg_card']
-plt.rcParams['figure.facecolor'] = COLORS['bg_dark']
-plt.rcParams['axes.edgecolor'] = COLORS['border']
-plt.rcParams['grid.color'] = COLORS['grid']
-plt.rcParams['text.color'] = COLORS['text_primary']
-plt.rcParams['axes.labelcolor'] = COLORS['text_primary']
-plt.rcParams['xtick.color'] = COLORS['text_secondary']
-plt.rcParams['ytick.color'] = COLORS['text_secondary']
+plt.rcParams.update({
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
+    'font.size': 9,
+    'axes.facecolor': COLORS['bg_card'],
+    'figure.facecolor': COLORS['bg_dark'],
+    'axes.edgecolor': COLORS['border'],
+    'grid.color': COLORS['grid'],
+    'text.color': COLORS['text_primary'],
+    'axes.labelcolor': COLORS['text_primary'],
+    'xtick.color': COLORS['text_secondary'],
+    'ytick.color': COLORS['text_secondary'],
+})
+
+# Shared fonts for the title, label and card value styles used on every
+# dashboard, kept in one place so those styles stay consistent
+FP_TITLE = FontProperties(size=12, weight='bold')
+FP_LABEL = FontProperties(size=10)
+FP_VALUE = FontProperties(size=28, weight='bold')
+
+# Every metric card has the same rounded outline; build its path once and
+# reuse it instead of re-running the round boxstyle for each card
+_CARD_PATH = FancyBboxPatch((0.05, 0.1), 0.9, 0.8, boxstyle="round,pad=0.05").get_path()
+
+def add_decor_axes(fig, spec, xlim=(0, 1), ylim=(0, 1)):
+    """Add a frameless, tickless Axes for cards, lists and diagrams
+
+    Ticks and frame are off from construction, so no tick artists are built
+    for an Axes whose axis is never shown.
+    """
+    ax = fig.add_subplot(spec, frameon=False, xticks=[], yticks=[], xlim=xlim, ylim=ylim)
+    ax.set_axis_off()
+    return ax
 
 def add_card(ax, title, value=None, subtitle=None, trend=None):
-    """Add a professional metric card"""
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.axis('off')
-
+    """Add a professional metric card to an Axes from add_decor_axes"""
     # Card background
-    card = FancyBboxPatch((0.05, 0.1), 0.9, 0.8,
-                           boxstyle="round,pad=0.05",
-                           facecolor=COLORS['bg_card'],
-                           edgecolor=COLORS['border'],
-                           linewidth=2,
-                           alpha=0.9)
+    card = PathPatch(_CARD_PATH,
+                     facecolor=COLORS['bg_card'],
+                     edgecolor=COLORS['border'],
+                     linewidth=2,
+                     alpha=0.9)
     ax.add_patch(card)
 
     # Title
     ax.text(0.5, 0.75, title, ha='center', va='center',
-            fontsize=10, color=COLORS['text_secondary'], weight='normal')
+            fontproperties=FP_LABEL, color=COLORS['text_secondary'])
 
     # Value
     if value:
         ax.text(0.5, 0.45, value, ha='center', va='center',
-                fontsize=28, color=COLORS['text_primary'], weight='bold')
+                fontproperties=FP_VALUE, color=COLORS['text_primary'])
 
     # Subtitle
     if subtitle:
@@ -76,48 +100,207 @@ def add_card(ax, title, value=None, subtitle=None, trend=None):
         ax.text(0.5, 0.25, subtitle, ha='center', va='center',
                 fontsize=9, color=color, weight='normal')
 
-def generate_soc_dashboard():
+def add_pie(ax, values, labels, colors, pct_format, width=None, fontsize=10):
+    """Draw a pie, or a donut when given a ring width, from Wedge patches
+
+    Mirrors ax.pie's layout (start at 12 o'clock, labels at 1.1 radii,
+    percentages at 0.6) without its per-call validation and autopct work.
+    """
+    values = np.asarray(values, dtype=float)
+    fracs = values / values.sum()
+    bounds = 90 + 360 * np.concatenate(([0], np.cumsum(fracs)))
+    mids = np.deg2rad((bounds[:-1] + bounds[1:]) / 2)
+    xs, ys = np.cos(mids), np.sin(mids)
+    text_style = dict(color=COLORS['text_primary'], fontsize=fontsize, weight='bold',
+                      va='center', clip_on=False)
+
+    for start, end, color in zip(bounds[:-1], bounds[1:], colors):
+        ax.add_patch(Wedge((0, 0), 1, start, end, width=width, facecolor=color,
+                           edgecolor=COLORS['border'], linewidth=2, clip_on=False))
+    for x, y, label in zip(xs, ys, labels):
+        ax.text(1.1 * x, 1.1 * y, label, ha='left' if x > 0 else 'right', **text_style)
+    for x, y, frac in zip(xs, ys, fracs):
+        ax.text(0.6 * x, 0.6 * y, pct_format % (100 * frac), ha='center', **text_style)
+
+    ax.set(aspect='equal', frame_on=False, xticks=[], yticks=[],
+           xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+
+def add_text_panel(fig, spec, title):
+    """Title a grid cell and return a transform for drawing text into it
+
+    Text-only panels need no Axes: text placed with the returned transform
+    uses the cell's 0-1 coordinates, as ax.text with transAxes would.
+    """
+    trans = BboxTransformTo(spec.get_position(fig)) + fig.transFigure
+    # Same spot as ax.set_title(..., pad=15)
+    fig.text(0.5, 1.0, title, transform=offset_copy(trans, fig=fig, y=15, units='points'),
+             ha='center', va='baseline', fontproperties=FP_TITLE, color=COLORS['text_primary'])
+    return trans
+
+# Figures reused across dashboards, keyed by figure size
+_FIGURES = {}
+
+def make_grid(nrows, ncols, title, subtitle, figsize=(16, 10), fig=None, left=0.05):
+    """Return a cleared, reusable dashboard figure with its title and grid
+
+    Pass fig to lay out a figure the caller owns instead of a shared one.
+    Figures are saved at their full size, so dashboards with long y tick
+    labels need a wider left margin to keep the labels on the canvas.
+    """
+    if fig is None:
+        fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = _FIGURES[figsize] = plt.figure(figsize=figsize, facecolor=COLORS['bg_dark'])
+    else:
+        fig.clf()
+
+    fig.suptitle(title, fontsize=20, fontweight='bold', color=COLORS['text_primary'], y=0.98)
+    fig.text(0.5, 0.95, subtitle, ha='center', fontsize=11, color=COLORS['text_secondary'])
+
+    gs = fig.add_gridspec(nrows, ncols, hspace=0.4, wspace=0.3, top=0.92, bottom=0.05, left=left, right=0.95)
+    return fig, gs
+
+# Seed for the synthetic chart data
+SEED = 42
+
+def build_dataset(rng):
+    """Build every synthetic series the dashboards plot, keyed by name"""
+    hours = np.arange(24)
+    times = np.linspace(0, 24, 200)
+    days30 = np.arange(30)
+    days90 = np.arange(90)
+
+    # One draw per distribution; the per-row scales broadcast across columns
+    threats = rng.poisson([[2], [5], [12], [20]], size=(4, 24))
+    noise = rng.normal(0, [[5], [3], [5], [2]], size=(4, 200))
+
+    violations = np.maximum(0, 50 - days30 + noise[2, :30])
+    return {
+        'hours': hours,
+        'threats': threats,
+        'times': times,
+        'process_events': np.sin(times * 0.5) * 20 + 40 + noise[0],
+        'network_events': np.cos(times * 0.7) * 15 + 35 + noise[1],
+        'days30': days30,
+        'violations': violations,
+        'blocked': violations * 0.7 + noise[3, :30],
+        'days90': days90,
+        'score': 60 + days90 * 0.12 + np.sin(days90 * 0.1) * 3,
+    }
+
+# 16x10in at 100 dpi is 1600x1000px: enough for the README and web pages,
+# with 2.25x fewer pixels to rasterize than 150 dpi
+DPI = 100
+
+# The README embeds the PNGs; set DASHBOARD_FORMAT=svg for web pages. SVG
+# output skips the Agg rasterizer entirely and stays sharp at any size.
+IMAGE_FORMAT = os.environ.get('DASHBOARD_FORMAT', 'png')
+
+def lttb(x, y, n_out):
+    """Downsample a line to n_out points with Largest-Triangle-Three-Buckets"""
+    if n_out >= len(x) or n_out < 3:
+        return x, y
+
+    # First and last points are kept; the rest are split into n_out-2 buckets
+    edges = np.linspace(1, len(x) - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, len(x) - 1
+
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(hi, edges[i + 2]) if i + 2 < len(edges) else slice(len(x) - 1, len(x))
+        px, py = x[keep[i]], y[keep[i]]
+        cx, cy = x[nxt].mean(), y[nxt].mean()
+        # Pick the point forming the largest triangle with the previously
+        # kept point and the average of the next bucket
+        area = np.abs((px - cx) * (y[lo:hi] - py) - (px - x[lo:hi]) * (cy - py))
+        keep[i + 1] = lo + np.argmax(area)
+
+    return x[keep], y[keep]
+
+def tree_layout(parents):
+    """Lay out a tree given each node's parent index (-1 for the root)
+
+    Leaves are spaced 2 units apart in depth-first order (siblings by index),
+    each parent is centred over its children and every level sits 2 units
+    below the one above. Nodes may be listed in any order.
+    """
+    parents = np.asarray(parents)
+    depth = np.zeros(len(parents), dtype=int)
+    level = parents < 0
+    d = 0
+    while level.any():
+        depth[level] = d
+        level = np.isin(parents, np.flatnonzero(level))
+        d += 1
+
+    # Root-to-node path of every node, padded with -1 past its own depth;
+    # sorting the leaves' paths lexicographically gives depth-first order
+    paths = np.full((len(parents), depth.max() + 1), -1)
+    node = np.arange(len(parents))
+    while (node >= 0).any():
+        valid = np.flatnonzero(node >= 0)
+        paths[valid, depth[node[valid]]] = node[valid]
+        node[valid] = parents[node[valid]]
+
+    leaves = np.flatnonzero(~np.isin(np.arange(len(parents)), parents))
+    leaves = leaves[np.lexsort(paths[leaves].T[::-1])]
+    is_leaf = np.zeros(len(parents), dtype=bool)
+    is_leaf[leaves] = True
+    xs = np.zeros(len(parents))
+    xs[leaves] = 2 * np.arange(1, len(leaves) + 1)
+    # Walk up from the deepest parents, averaging each level's children
+    for d in range(depth.max() - 1, -1, -1):
+        kids = depth == d + 1
+        sums = np.bincount(parents[kids], weights=xs[kids], minlength=len(parents))
+        counts = np.bincount(parents[kids], minlength=len(parents))
+        inner = (depth == d) & ~is_leaf
+        xs[inner] = sums[inner] / counts[inner]
+
+    return xs, 9 - 2 * depth
+
+def save_dashboard(fig, name):
+    """Save a dashboard figure to docs/images"""
+    filename = f'dashboard-{name}.{IMAGE_FORMAT}'
+    fig.savefig(f'docs/images/{filename}', dpi=DPI, facecolor=COLORS['bg_dark'])
+    print(f"✅ Generated: {filename}")
+
+def generate_soc_dashboard(data):
     """Generate SOC Operations Center Dashboard"""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg_dark'])
-
-    # Title
-    fig.suptitle('Security Operations Center - Live Threat Monitoring',
-                 fontsize=20, fontweight='bold', color=COLORS['text_primary'], y=0.98)
-    fig.text(0.5, 0.95, 'Real-time endpoint protection across 10,247 agents',
-             ha='center', fontsize=11, color=COLORS['text_secondary'])
-
-    # Create grid
-    gs = fig.add_gridspec(4, 6, hspace=0.4, wspace=0.3, top=0.92, bottom=0.05, left=0.05, right=0.95)
+    fig, gs = make_grid(4, 6, 'Security Operations Center - Live Threat Monitoring',
+                        'Real-time endpoint protection across 10,247 agents', left=0.1)
 
     # Row 1: Key Metrics Cards
-    ax1 = fig.add_subplot(gs[0, :2])
+    ax1 = add_decor_axes(fig, gs[0, :2])
     add_card(ax1, 'ACTIVE THREATS', '23', '↓ 15% vs yesterday', trend=-15)
 
-    ax2 = fig.add_subplot(gs[0, 2:4])
+    ax2 = add_decor_axes(fig, gs[0, 2:4])
     add_card(ax2, 'EVENTS/SECOND', '12.5K', '↑ 3.2% vs avg', trend=3.2)
 
-    ax3 = fig.add_subplot(gs[0, 4:])
+    ax3 = add_decor_axes(fig, gs[0, 4:])
     add_card(ax3, 'AGENTS ONLINE', '10,247', '99.8% uptime', trend=0)
 
     # Row 2: Threat Timeline
     ax4 = fig.add_subplot(gs[1, :])
     ax4.set_facecolor(COLORS['bg_card'])
-    ax4.set_title('Threat Detection Timeline (Last 24 Hours)', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-
-    hours = np.arange(24)
-    critical = np.random.poisson(2, 24)
-    high = np.random.poisson(5, 24)
-    medium = np.random.poisson(12, 24)
-    low = np.random.poisson(20, 24)
-
-    ax4.fill_between(hours, 0, critical, alpha=0.9, color=COLORS['critical'], label='Critical')
-    ax4.fill_between(hours, critical, critical+high, alpha=0.8, color=COLORS['high'], label='High')
-    ax4.fill_between(hours, critical+high, critical+high+medium, alpha=0.7, color=COLORS['medium'], label='Medium')
-    ax4.fill_between(hours, critical+high+medium, critical+high+medium+low, alpha=0.6, color=COLORS['low'], label='Low')
-
-    ax4.set_xlabel('Hour of Day', fontsize=10, color=COLORS['text_secondary'])
-    ax4.set_ylabel('Threat Count', fontsize=10, color=COLORS['text_secondary'])
+    ax4.set_title('Threat Detection Timeline (Last 24 Hours)', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
+
+    hours = data['hours']
+
+    # stackplot takes the (4, 24) severity array as is and stacks it with a
+    # single cumsum along the severity axis
+    layer_colors = [COLORS['critical'], COLORS['high'], COLORS['medium'], COLORS['low']]
+    layers = ax4.stackplot(hours, data['threats'], colors=layer_colors,
+                           labels=['Critical', 'High', 'Medium', 'Low'])
+    # Match the fill_between layers this replaced: stackplot only sets the
+    # face colour, and pins the y axis to 0 where fill_between left a margin
+    for layer, color, alpha in zip(layers, layer_colors, (0.9, 0.8, 0.7, 0.6)):
+        layer.set(edgecolor=color, alpha=alpha)
+    layers[0].sticky_edges.y.clear()
+
+    ax4.set_xlabel('Hour of Day', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+    ax4.set_ylabel('Threat Count', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
     ax4.legend(loc='upper left', framealpha=0.9, facecolor=COLORS['bg_card_hover'])
     ax4.grid(True, alpha=0.2, linestyle='--')
     ax4.spines['top'].set_visible(False)
@@ -126,13 +309,15 @@ def generate_soc_dashboard():
     # Row 3: MITRE ATT&CK Heat Map
     ax5 = fig.add_subplot(gs[2, :4])
     ax5.set_facecolor(COLORS['bg_card'])
-    ax5.set_title('MITRE ATT&CK Tactics Coverage', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax5.set_title('MITRE ATT&CK Tactics Coverage', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     tactics = ['Initial\nAccess', 'Execution', 'Persistence', 'Priv Esc', 'Defense\nEvasion',
                'Credential\nAccess', 'Discovery', 'Lateral\nMovement', 'Collection', 'Exfiltration']
     detections = [8, 15, 12, 6, 22, 4, 18, 3, 7, 2]
-    colors_bar = [COLORS['danger'] if d > 15 else COLORS['warning'] if d > 8 else COLORS['accent'] for d in detections]
+    # Bucket counts (<=8, <=15, >15) straight into a palette index
+    palette = np.array([COLORS['accent'], COLORS['warning'], COLORS['danger']])
+    colors_bar = palette[np.digitize(detections, [8, 15], right=True)]
 
     bars = ax5.barh(tactics, detections, color=colors_bar, alpha=0.8, edgecolor=COLORS['border'], linewidth=1.5)
 
@@ -140,7 +325,7 @@ def generate_soc_dashboard():
     for i, (bar, val) in enumerate(zip(bars, detections)):
         ax5.text(val + 0.5, i, f'{val}', va='center', fontsize=10, color=COLORS['text_primary'], weight='bold')
 
-    ax5.set_xlabel('Detections Today', fontsize=10, color=COLORS['text_secondary'])
+    ax5.set_xlabel('Detections Today', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
     ax5.grid(axis='x', alpha=0.2, linestyle='--')
     ax5.spines['top'].set_visible(False)
     ax5.spines['right'].set_visible(False)
@@ -149,23 +334,20 @@ def generate_soc_dashboard():
     # Row 3: Severity Distribution (Donut Chart)
     ax6 = fig.add_subplot(gs[2, 4:])
     ax6.set_facecolor(COLORS['bg_card'])
-    ax6.set_title('Alert Severity Distribution', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax6.set_title('Alert Severity Distribution', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     severities = [23, 45, 87, 145]
     severity_labels = ['Critical', 'High', 'Medium', 'Low']
     severity_colors = [COLORS['critical'], COLORS['high'], COLORS['medium'], COLORS['low']]
 
-    wedges, texts, autotexts = ax6.pie(severities, labels=severity_labels, autopct='%1.1f%%',
-                                        colors=severity_colors, startangle=90,
-                                        wedgeprops=dict(width=0.4, edgecolor=COLORS['border'], linewidth=2),
-                                        textprops=dict(color=COLORS['text_primary'], fontsize=10, weight='bold'))
+    add_pie(ax6, severities, severity_labels, severity_colors, '%1.1f%%', width=0.4)
 
     # Row 4: Top Affected Hosts
     ax7 = fig.add_subplot(gs[3, :3])
     ax7.set_facecolor(COLORS['bg_card'])
-    ax7.set_title('Top 5 Affected Endpoints', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax7.set_title('Top 5 Affected Endpoints', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     hosts = ['DESKTOP-A4F21', 'LAPTOP-8B92E', 'SERVER-DC01', 'WORKSTATION-45', 'DEVBOX-STAGING']
     incidents = [18, 14, 12, 9, 7]
@@ -175,18 +357,14 @@ def generate_soc_dashboard():
     for i, (bar, val) in enumerate(zip(bars2, incidents)):
         ax7.text(val + 0.3, i, f'{val} alerts', va='center', fontsize=9, color=COLORS['text_primary'])
 
-    ax7.set_xlabel('Alert Count', fontsize=10, color=COLORS['text_secondary'])
+    ax7.set_xlabel('Alert Count', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
     ax7.grid(axis='x', alpha=0.2, linestyle='--')
     ax7.spines['top'].set_visible(False)
     ax7.spines['right'].set_visible(False)
     ax7.set_xlim(0, max(incidents) + 5)
 
     # Row 4: Recent Critical Alerts
-    ax8 = fig.add_subplot(gs[3, 3:])
-    ax8.set_facecolor(COLORS['bg_card'])
-    ax8.set_title('Recent Critical Alerts', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-    ax8.axis('off')
+    panel = add_text_panel(fig, gs[3, 3:], 'Recent Critical Alerts')
 
     alerts = [
         ('15:42', 'Ransomware Activity Detected', 'LAPTOP-8B92E'),
@@ -195,101 +373,99 @@ def generate_soc_dashboard():
         ('11:05', 'C2 Beacon Communication', 'WORKSTATION-45'),
     ]
 
-    y_pos = 0.85
-    for time, alert, host in alerts:
-        ax8.text(0.05, y_pos, f'🔴 {time}', fontsize=9, color=COLORS['critical'], weight='bold')
-        ax8.text(0.05, y_pos - 0.08, alert, fontsize=9, color=COLORS['text_primary'])
-        ax8.text(0.05, y_pos - 0.14, f'Host: {host}', fontsize=8, color=COLORS['text_secondary'], style='italic')
-        y_pos -= 0.23
+    time_style = dict(fontsize=9, color=COLORS['critical'], weight='bold', transform=panel)
+    alert_style = dict(fontsize=9, color=COLORS['text_primary'], transform=panel)
+    host_style = dict(fontsize=8, color=COLORS['text_secondary'], style='italic', transform=panel)
+    rows_y = 0.85 - 0.23 * np.arange(len(alerts))
+    for y_pos, (time, alert, host) in zip(rows_y, alerts):
+        fig.text(0.05, y_pos, f'🔴 {time}', **time_style)
+        fig.text(0.05, y_pos - 0.08, alert, **alert_style)
+        fig.text(0.05, y_pos - 0.14, f'Host: {host}', **host_style)
 
-    plt.savefig('docs/images/dashboard-soc.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg_dark'])
-    print("✅ Generated: dashboard-soc.png")
-    plt.close()
+    save_dashboard(fig, 'soc')
 
-def generate_threat_hunting_dashboard():
+def generate_threat_hunting_dashboard(data):
     """Generate Threat Hunting Workbench Dashboard"""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg_dark'])
-
-    fig.suptitle('Threat Hunting Workbench - Advanced Investigation',
-                 fontsize=20, fontweight='bold', color=COLORS['text_primary'], y=0.98)
-    fig.text(0.5, 0.95, 'Query billions of events in <100ms with ClickHouse analytics',
-             ha='center', fontsize=11, color=COLORS['text_secondary'])
-
-    gs = fig.add_gridspec(4, 4, hspace=0.4, wspace=0.3, top=0.92, bottom=0.05, left=0.05, right=0.95)
+    fig, gs = make_grid(4, 4, 'Threat Hunting Workbench - Advanced Investigation',
+                        'Query billions of events in <100ms with ClickHouse analytics')
 
     # Query Stats Cards
-    ax1 = fig.add_subplot(gs[0, 0])
+    ax1 = add_decor_axes(fig, gs[0, 0])
     add_card(ax1, 'QUERY TIME', '47ms', 'Lightning fast')
 
-    ax2 = fig.add_subplot(gs[0, 1])
+    ax2 = add_decor_axes(fig, gs[0, 1])
     add_card(ax2, 'RESULTS', '1,247', 'events found')
 
-    ax3 = fig.add_subplot(gs[0, 2])
+    ax3 = add_decor_axes(fig, gs[0, 2])
     add_card(ax3, 'TIME RANGE', '24h', 'scanning period')
 
-    ax4 = fig.add_subplot(gs[0, 3])
+    ax4 = add_decor_axes(fig, gs[0, 3])
     add_card(ax4, 'DATA SCANNED', '2.4TB', 'compressed')
 
     # Event Timeline
     ax5 = fig.add_subplot(gs[1, :])
     ax5.set_facecolor(COLORS['bg_card'])
-    ax5.set_title('Event Timeline - Process Creation & Network Connections', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax5.set_title('Event Timeline - Process Creation & Network Connections', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
-    times = np.linspace(0, 24, 200)
-    process_events = np.sin(times * 0.5) * 20 + 40 + np.random.normal(0, 5, 200)
-    network_events = np.cos(times * 0.7) * 15 + 35 + np.random.normal(0, 3, 200)
+    times = data['times']
+    process_events = data['process_events']
+    network_events = data['network_events']
+
+    # 200 samples overdraw the same pixels at this width; 50 keep the shape
+    t_proc, process_events = lttb(times, process_events, 50)
+    t_net, network_events = lttb(times, network_events, 50)
 
-    ax5.plot(times, process_events, color=COLORS['primary'], linewidth=2, label='Process Creation', alpha=0.9)
-    ax5.plot(times, network_events, color=COLORS['accent'], linewidth=2, label='Network Connections', alpha=0.9)
-    ax5.fill_between(times, process_events, alpha=0.2, color=COLORS['primary'])
-    ax5.fill_between(times, network_events, alpha=0.2, color=COLORS['accent'])
+    ax5.plot(t_proc, process_events, color=COLORS['primary'], linewidth=2, label='Process Creation', alpha=0.9)
+    ax5.plot(t_net, network_events, color=COLORS['accent'], linewidth=2, label='Network Connections', alpha=0.9)
+    ax5.fill_between(t_proc, process_events, alpha=0.2, color=COLORS['primary'])
+    ax5.fill_between(t_net, network_events, alpha=0.2, color=COLORS['accent'])
 
-    ax5.set_xlabel('Hour of Day', fontsize=10, color=COLORS['text_secondary'])
-    ax5.set_ylabel('Events per Minute', fontsize=10, color=COLORS['text_secondary'])
+    ax5.set_xlabel('Hour of Day', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+    ax5.set_ylabel('Events per Minute', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
     ax5.legend(loc='upper right', framealpha=0.9, facecolor=COLORS['bg_card_hover'])
     ax5.grid(True, alpha=0.2, linestyle='--')
     ax5.spines['top'].set_visible(False)
     ax5.spines['right'].set_visible(False)
 
     # Process Tree Visualization
-    ax6 = fig.add_subplot(gs[2:, :2])
-    ax6.set_facecolor(COLORS['bg_card'])
-    ax6.set_title('Process Execution Tree', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-    ax6.set_xlim(0, 10)
-    ax6.set_ylim(0, 10)
-    ax6.axis('off')
+    ax6 = add_decor_axes(fig, gs[2:, :2], xlim=(0, 10), ylim=(0, 10))
+    ax6.set_title('Process Execution Tree', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
-    # Draw process tree
+    # Draw process tree; each process lists the index of its parent
     processes = [
-        (5, 9, 'explorer.exe', COLORS['accent']),
-        (3, 7, 'cmd.exe', COLORS['warning']),
-        (7, 7, 'powershell.exe', COLORS['danger']),
-        (2, 5, 'certutil.exe', COLORS['critical']),
-        (4, 5, 'net.exe', COLORS['danger']),
-        (6, 5, 'reg.exe', COLORS['danger']),
-        (8, 5, 'rundll32.exe', COLORS['critical']),
+        ('explorer.exe', -1, COLORS['accent']),
+        ('cmd.exe', 0, COLORS['warning']),
+        ('powershell.exe', 0, COLORS['danger']),
+        ('certutil.exe', 1, COLORS['critical']),
+        ('net.exe', 1, COLORS['danger']),
+        ('reg.exe', 2, COLORS['danger']),
+        ('rundll32.exe', 2, COLORS['critical']),
     ]
+    names, parents, node_colors = zip(*processes)
+    xs, ys = tree_layout(parents)
 
-    # Draw connections
-    connections = [(5, 9, 3, 7), (5, 9, 7, 7), (3, 7, 2, 5), (3, 7, 4, 5), (7, 7, 6, 5), (7, 7, 8, 5)]
-    for x1, y1, x2, y2 in connections:
-        ax6.plot([x1, x2], [y1-0.3, y2+0.3], color=COLORS['text_secondary'], linewidth=1.5, alpha=0.5, linestyle='--')
+    # Draw connections as one collection, above the nodes like plotted lines
+    kids = np.flatnonzero(np.asarray(parents) >= 0)
+    above = np.asarray(parents)[kids]
+    segments = np.stack([np.column_stack([xs[above], ys[above] - 0.3]),
+                         np.column_stack([xs[kids], ys[kids] + 0.3])], axis=1)
+    ax6.add_collection(LineCollection(segments, colors=COLORS['text_secondary'], linewidths=1.5,
+                                      linestyles='--', alpha=0.5, zorder=2), autolim=False)
 
     # Draw process nodes
-    for x, y, name, color in processes:
-        circle = Circle((x, y), 0.4, facecolor=color, edgecolor=COLORS['border'], linewidth=2, alpha=0.8)
-        ax6.add_patch(circle)
+    ax6.add_collection(PatchCollection([Circle((x, y), 0.4) for x, y in zip(xs, ys)],
+                                       facecolors=node_colors, edgecolors=COLORS['border'],
+                                       linewidths=2, alpha=0.8), autolim=False)
+    for x, y, name in zip(xs, ys, names):
         ax6.text(x, y, name.split('.')[0][:8], ha='center', va='center', fontsize=8, color='white', weight='bold')
         ax6.text(x, y-0.7, name, ha='center', va='top', fontsize=7, color=COLORS['text_secondary'])
 
     # IOC Correlation
-    ax7 = fig.add_subplot(gs[2:, 2:])
-    ax7.set_facecolor(COLORS['bg_card'])
-    ax7.set_title('Threat Intelligence Matches', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-    ax7.axis('off')
+    ax7 = add_decor_axes(fig, gs[2:, 2:])
+    ax7.set_title('Threat Intelligence Matches', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     iocs = [
         ('IP Address', '192.168.1.100', 'Cobalt Strike C2', COLORS['critical']),
@@ -300,68 +476,58 @@ def generate_threat_hunting_dashboard():
         ('Network Port', 'TCP:4444', 'Reverse Shell', COLORS['critical']),
     ]
 
-    y_pos = 0.92
-    for ioc_type, value, threat, color in iocs:
-        # Background box
-        rect = FancyBboxPatch((0.05, y_pos-0.12), 0.9, 0.13,
-                              boxstyle="round,pad=0.01",
-                              facecolor=COLORS['bg_card_hover'],
-                              edgecolor=color,
-                              linewidth=2,
-                              alpha=0.6)
-        ax7.add_patch(rect)
-
-        ax7.text(0.08, y_pos-0.03, f'{ioc_type}:', fontsize=9, color=COLORS['text_secondary'], weight='bold')
-        ax7.text(0.08, y_pos-0.08, value, fontsize=8, color=COLORS['text_primary'], family='monospace')
-        ax7.text(0.92, y_pos-0.055, threat, ha='right', fontsize=9, color=color, weight='bold')
-
-        y_pos -= 0.155
+    type_style = dict(fontsize=9, color=COLORS['text_secondary'], weight='bold')
+    value_style = dict(fontsize=8, color=COLORS['text_primary'], family='monospace')
+    rows_y = 0.92 - 0.155 * np.arange(len(iocs))
 
-    plt.savefig('docs/images/dashboard-hunting.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg_dark'])
-    print("✅ Generated: dashboard-hunting.png")
-    plt.close()
+    # Background boxes, outlined in each row's threat colour
+    boxes = [FancyBboxPatch((0.05, y_pos-0.12), 0.9, 0.13, boxstyle="round,pad=0.01") for y_pos in rows_y]
+    ax7.add_collection(PatchCollection(boxes, facecolors=COLORS['bg_card_hover'],
+                                       edgecolors=[ioc[3] for ioc in iocs],
+                                       linewidths=2, alpha=0.6), autolim=False)
 
-def generate_dlp_dashboard():
-    """Generate DLP Management Dashboard"""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg_dark'])
+    for y_pos, (ioc_type, value, threat, color) in zip(rows_y, iocs):
+        ax7.text(0.08, y_pos-0.03, f'{ioc_type}:', **type_style)
+        ax7.text(0.08, y_pos-0.08, value, **value_style)
+        ax7.text(0.92, y_pos-0.055, threat, ha='right', fontsize=9, color=color, weight='bold')
 
-    fig.suptitle('Data Loss Prevention - Policy Management',
-                 fontsize=20, fontweight='bold', color=COLORS['text_primary'], y=0.98)
-    fig.text(0.5, 0.95, 'Cryptographic fingerprinting protecting 2.4M sensitive documents',
-             ha='center', fontsize=11, color=COLORS['text_secondary'])
+    save_dashboard(fig, 'hunting')
 
-    gs = fig.add_gridspec(4, 4, hspace=0.4, wspace=0.3, top=0.92, bottom=0.05, left=0.05, right=0.95)
+def generate_dlp_dashboard(data):
+    """Generate DLP Management Dashboard"""
+    fig, gs = make_grid(4, 4, 'Data Loss Prevention - Policy Management',
+                        'Cryptographic fingerprinting protecting 2.4M sensitive documents', left=0.1)
 
     # Metrics Cards
-    ax1 = fig.add_subplot(gs[0, 0])
+    ax1 = add_decor_axes(fig, gs[0, 0])
     add_card(ax1, 'VIOLATIONS', '47', '↓ 23% vs last week', trend=-23)
 
-    ax2 = fig.add_subplot(gs[0, 1])
+    ax2 = add_decor_axes(fig, gs[0, 1])
     add_card(ax2, 'POLICIES', '18', 'active rules')
 
-    ax3 = fig.add_subplot(gs[0, 2])
+    ax3 = add_decor_axes(fig, gs[0, 2])
     add_card(ax3, 'FILES SCANNED', '2.4M', 'fingerprinted')
 
-    ax4 = fig.add_subplot(gs[0, 3])
+    ax4 = add_decor_axes(fig, gs[0, 3])
     add_card(ax4, 'BLOCKED', '12', 'exfiltration attempts')
 
     # Violations Trend
     ax5 = fig.add_subplot(gs[1, :])
     ax5.set_facecolor(COLORS['bg_card'])
-    ax5.set_title('DLP Violations Trend (Last 30 Days)', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax5.set_title('DLP Violations Trend (Last 30 Days)', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
-    days = np.arange(30)
-    violations = np.maximum(0, 50 - days + np.random.normal(0, 5, 30))
-    blocked = violations * 0.7 + np.random.normal(0, 2, 30)
+    days = data['days30']
+    violations = data['violations']
+    blocked = data['blocked']
 
     ax5.plot(days, violations, color=COLORS['danger'], linewidth=2.5, label='Violations Detected', marker='o', markersize=4)
     ax5.plot(days, blocked, color=COLORS['accent'], linewidth=2.5, label='Blocked', marker='s', markersize=4)
     ax5.fill_between(days, violations, alpha=0.2, color=COLORS['danger'])
     ax5.fill_between(days, blocked, alpha=0.2, color=COLORS['accent'])
 
-    ax5.set_xlabel('Days Ago', fontsize=10, color=COLORS['text_secondary'])
-    ax5.set_ylabel('Violation Count', fontsize=10, color=COLORS['text_secondary'])
+    ax5.set_xlabel('Days Ago', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+    ax5.set_ylabel('Violation Count', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
     ax5.legend(loc='upper right', framealpha=0.9, facecolor=COLORS['bg_card_hover'])
     ax5.grid(True, alpha=0.2, linestyle='--')
     ax5.spines['top'].set_visible(False)
@@ -370,8 +536,8 @@ def generate_dlp_dashboard():
     # Data Types Protected
     ax6 = fig.add_subplot(gs[2, :2])
     ax6.set_facecolor(COLORS['bg_card'])
-    ax6.set_title('Protected Data Types', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax6.set_title('Protected Data Types', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     data_types = ['Credit Cards', 'SSN/PII', 'Source Code', 'Financial', 'Health Records', 'API Keys']
     files_count = [245000, 180000, 420000, 95000, 380000, 62000]
@@ -381,7 +547,7 @@ def generate_dlp_dashboard():
     for i, (bar, val) in enumerate(zip(bars, files_count)):
         ax6.text(val + 10000, i, f'{val/1000:.0f}K', va='center', fontsize=10, color=COLORS['text_primary'], weight='bold')
 
-    ax6.set_xlabel('Files Fingerprinted', fontsize=10, color=COLORS['text_secondary'])
+    ax6.set_xlabel('Files Fingerprinted', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
     ax6.grid(axis='x', alpha=0.2, linestyle='--')
     ax6.spines['top'].set_visible(False)
     ax6.spines['right'].set_visible(False)
@@ -389,24 +555,19 @@ def generate_dlp_dashboard():
     # Violation Channels
     ax7 = fig.add_subplot(gs[2, 2:])
     ax7.set_facecolor(COLORS['bg_card'])
-    ax7.set_title('Violations by Channel', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
+    ax7.set_title('Violations by Channel', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     channels = ['Email', 'Cloud Upload', 'USB Drive', 'Print', 'Network Share']
     violations_ch = [18, 12, 8, 5, 4]
     channel_colors = [COLORS['danger'], COLORS['high'], COLORS['medium'], COLORS['warning'], COLORS['accent']]
 
-    wedges, texts, autotexts = ax7.pie(violations_ch, labels=channels, autopct='%1.0f%%',
-                                        colors=channel_colors, startangle=90,
-                                        wedgeprops=dict(width=0.4, edgecolor=COLORS['border'], linewidth=2),
-                                        textprops=dict(color=COLORS['text_primary'], fontsize=10, weight='bold'))
+    add_pie(ax7, violations_ch, channels, channel_colors, '%1.0f%%', width=0.4)
 
     # Active Policies
-    ax8 = fig.add_subplot(gs[3, :])
-    ax8.set_facecolor(COLORS['bg_card'])
-    ax8.set_title('Active DLP Policies', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-    ax8.axis('off')
+    ax8 = add_decor_axes(fig, gs[3, :])
+    ax8.set_title('Active DLP Policies', fontproperties=FP_TITLE,
+                  color=COLORS['text_primary'], pad=15)
 
     policies = [
         ('PCI DSS - Credit Card Protection', '245K files', 'High', COLORS['danger']),
@@ -417,167 +578,193 @@ def generate_dlp_dashboard():
         ('Financial Reports', '95K files', 'Medium', COLORS['warning']),
     ]
 
-    y_pos = 0.92
-    for name, files, severity, color in policies:
-        # Background box
-        rect = FancyBboxPatch((0.03, y_pos-0.12), 0.94, 0.13,
-                              boxstyle="round,pad=0.01",
-                              facecolor=COLORS['bg_card_hover'],
-                              edgecolor=COLORS['border'],
-                              linewidth=1,
-                              alpha=0.5)
-        ax8.add_patch(rect)
-
-        # Severity indicator
-        circle = Circle((0.06, y_pos-0.055), 0.02, facecolor=color, edgecolor='none', alpha=0.9)
-        ax8.add_patch(circle)
-
-        ax8.text(0.10, y_pos-0.03, name, fontsize=10, color=COLORS['text_primary'], weight='bold')
-        ax8.text(0.10, y_pos-0.08, files, fontsize=9, color=COLORS['text_secondary'])
+    name_style = dict(fontsize=10, color=COLORS['text_primary'], weight='bold')
+    files_style = dict(fontsize=9, color=COLORS['text_secondary'])
+    rows_y = 0.92 - 0.155 * np.arange(len(policies))
+
+    # Background boxes and severity indicators
+    boxes = [FancyBboxPatch((0.03, y_pos-0.12), 0.94, 0.13, boxstyle="round,pad=0.01") for y_pos in rows_y]
+    ax8.add_collection(PatchCollection(boxes, facecolors=COLORS['bg_card_hover'],
+                                       edgecolors=COLORS['border'], linewidths=1, alpha=0.5),
+                       autolim=False)
+    dots = [Circle((0.06, y_pos-0.055), 0.02) for y_pos in rows_y]
+    ax8.add_collection(PatchCollection(dots, facecolors=[policy[3] for policy in policies],
+                                       edgecolors='none', alpha=0.9), autolim=False)
+
+    for y_pos, (name, files, severity, color) in zip(rows_y, policies):
+        ax8.text(0.10, y_pos-0.03, name, **name_style)
+        ax8.text(0.10, y_pos-0.08, files, **files_style)
         ax8.text(0.94, y_pos-0.055, severity, ha='right', fontsize=9, color=color, weight='bold')
 
-        y_pos -= 0.155
-
-    plt.savefig('docs/images/dashboard-dlp.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg_dark'])
-    print("✅ Generated: dashboard-dlp.png")
-    plt.close()
-
-def generate_executive_dashboard():
-    """Generate Executive Dashboard"""
-    fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg_dark'])
-
-    fig.suptitle('Executive Security Dashboard - At a Glance',
-                 fontsize=20, fontweight='bold', color=COLORS['text_primary'], y=0.98)
-    fig.text(0.5, 0.95, 'Enterprise-wide security posture and risk metrics',
-             ha='center', fontsize=11, color=COLORS['text_secondary'])
-
-    gs = fig.add_gridspec(4, 6, hspace=0.4, wspace=0.3, top=0.92, bottom=0.05, left=0.05, right=0.95)
-
-    # Key Metrics
-    ax1 = fig.add_subplot(gs[0, :2])
-    add_card(ax1, 'RISK SCORE', '72/100', '↑ 5 pts (Good)', trend=5)
-
-    ax2 = fig.add_subplot(gs[0, 2:4])
-    add_card(ax2, 'COMPLIANCE', '98.7%', 'SOC2, HIPAA, GDPR')
-
-    ax3 = fig.add_subplot(gs[0, 4:])
-    add_card(ax3, 'COST SAVINGS', '$840K', 'vs legacy tools')
-
-    # Security Posture Trend
-    ax4 = fig.add_subplot(gs[1, :3])
-    ax4.set_facecolor(COLORS['bg_card'])
-    ax4.set_title('Security Posture Score (90 Days)', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-
-    days = np.arange(90)
-    score = 60 + (days * 0.12) + np.sin(days * 0.1) * 3
-
-    ax4.plot(days, score, color=COLORS['accent'], linewidth=3, label='Posture Score')
-    ax4.fill_between(days, score, alpha=0.3, color=COLORS['accent'])
-    ax4.axhline(y=70, color=COLORS['warning'], linestyle='--', linewidth=1.5, label='Target', alpha=0.7)
-
-    ax4.set_xlabel('Days', fontsize=10, color=COLORS['text_secondary'])
-    ax4.set_ylabel('Score (0-100)', fontsize=10, color=COLORS['text_secondary'])
-    ax4.legend(loc='lower right', framealpha=0.9, facecolor=COLORS['bg_card_hover'])
-    ax4.grid(True, alpha=0.2, linestyle='--')
-    ax4.spines['top'].set_visible(False)
-    ax4.spines['right'].set_visible(False)
-    ax4.set_ylim(50, 85)
-
-    # Compliance Status
-    ax5 = fig.add_subplot(gs[1, 3:])
-    ax5.set_facecolor(COLORS['bg_card'])
-    ax5.set_title('Compliance Framework Status', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-
-    frameworks = ['SOC 2\nType II', 'HIPAA', 'GDPR', 'PCI DSS', 'ISO\n27001']
-    compliance = [100, 99, 98, 97, 96]
-    colors_comp = [COLORS['accent'] if c >= 98 else COLORS['warning'] for c in compliance]
-
-    bars = ax5.bar(frameworks, compliance, color=colors_comp, alpha=0.8, edgecolor=COLORS['border'], linewidth=1.5, width=0.6)
-
-    for bar, val in zip(bars, compliance):
-        height = bar.get_height()
-        ax5.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                f'{val}%', ha='center', va='bottom', fontsize=10, color=COLORS['text_primary'], weight='bold')
-
-    ax5.set_ylabel('Compliance %', fontsize=10, color=COLORS['text_secondary'])
-    ax5.set_ylim(90, 105)
-    ax5.axhline(y=95, color=COLORS['danger'], linestyle='--', linewidth=1.5, alpha=0.5)
-    ax5.grid(axis='y', alpha=0.2, linestyle='--')
-    ax5.spines['top'].set_visible(False)
-    ax5.spines['right'].set_visible(False)
-
-    # Threat Breakdown
-    ax6 = fig.add_subplot(gs[2, :3])
-    ax6.set_facecolor(COLORS['bg_card'])
-    ax6.set_title('Threat Category Breakdown (30 Days)', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-
-    categories = ['Malware', 'Phishing', 'DLP Violations', 'Insider Threat', 'Vuln Exploit', 'Misc']
-    incidents = [34, 28, 47, 12, 8, 6]
-    cat_colors = [COLORS['critical'], COLORS['danger'], COLORS['high'], COLORS['warning'], COLORS['medium'], COLORS['low']]
-
-    wedges, texts, autotexts = ax6.pie(incidents, labels=categories, autopct='%1.0f%%',
-                                        colors=cat_colors, startangle=90,
-                                        wedgeprops=dict(edgecolor=COLORS['border'], linewidth=2),
-                                        textprops=dict(color=COLORS['text_primary'], fontsize=9, weight='bold'))
-
-    # ROI Metrics
-    ax7 = fig.add_subplot(gs[2, 3:])
-    ax7.set_facecolor(COLORS['bg_card'])
-    ax7.set_title('Return on Investment (Year 1)', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-
-    roi_cats = ['Tool\nConsolidation', 'Reduced\nHeadcount', 'Prevented\nBreaches', 'Compliance\nEfficiency']
-    savings = [800, 200, 105, 90]
-
-    bars2 = ax7.bar(roi_cats, savings, color=COLORS['accent'], alpha=0.8, edgecolor=COLORS['border'], linewidth=1.5, width=0.6)
-
-    for bar, val in zip(bars2, savings):
-        height = bar.get_height()
-        ax7.text(bar.get_x() + bar.get_width()/2., height + 15,
-                f'${val}K', ha='center', va='bottom', fontsize=10, color=COLORS['text_primary'], weight='bold')
-
-    ax7.set_ylabel('Savings ($K)', fontsize=10, color=COLORS['text_secondary'])
-    ax7.grid(axis='y', alpha=0.2, linestyle='--')
-    ax7.spines['top'].set_visible(False)
-    ax7.spines['right'].set_visible(False)
-
-    # Risk Summary
-    ax8 = fig.add_subplot(gs[3, :])
-    ax8.set_facecolor(COLORS['bg_card'])
-    ax8.set_title('Risk Summary & Recommendations', fontsize=12,
-                  color=COLORS['text_primary'], weight='bold', pad=15)
-    ax8.axis('off')
-
-    risks = [
-        ('✅', 'SOC Team Fully Operational', f'{COLORS["accent"]} All 6 analysts trained on Privé platform', COLORS['accent']),
-        ('⚠️', 'Phishing Incidents +12% This Month', f'{COLORS["warning"]} Recommend additional user training', COLORS['warning']),
-        ('✅', 'Zero Critical Vulnerabilities', f'{COLORS["accent"]} All endpoints patched within 48hrs', COLORS['accent']),
-        ('⚠️', 'DLP Policy Coverage at 87%', f'{COLORS["warning"]} 13% of endpoints need policy updates', COLORS['warning']),
-        ('✅', '$840K Annual Cost Savings Achieved', f'{COLORS["accent"]} ROI realized in 4.2 months', COLORS['accent']),
-    ]
-
-    y_pos = 0.88
-    for icon, title, subtitle, color in risks:
-        ax8.text(0.02, y_pos, icon, fontsize=16, va='center')
-        ax8.text(0.06, y_pos+0.02, title, fontsize=11, color=COLORS['text_primary'], weight='bold', va='center')
-        ax8.text(0.06, y_pos-0.05, subtitle, fontsize=9, color=color, va='center')
-        y_pos -= 0.18
+    save_dashboard(fig, 'dlp')
+
+class ExecutiveDashboard:
+    """Executive Dashboard that keeps its artists between renders
+
+    The figure is built once; a refresh only swaps the posture score data
+    instead of rebuilding every axes and artist.
+    """
+
+    def __init__(self, data):
+        self.fig = plt.figure(figsize=(16, 10), facecolor=COLORS['bg_dark'])
+        fig, gs = make_grid(4, 6, 'Executive Security Dashboard - At a Glance',
+                            'Enterprise-wide security posture and risk metrics', fig=self.fig)
+
+        # Key Metrics
+        ax1 = add_decor_axes(fig, gs[0, :2])
+        add_card(ax1, 'RISK SCORE', '72/100', '↑ 5 pts (Good)', trend=5)
+
+        ax2 = add_decor_axes(fig, gs[0, 2:4])
+        add_card(ax2, 'COMPLIANCE', '98.7%', 'SOC2, HIPAA, GDPR')
+
+        ax3 = add_decor_axes(fig, gs[0, 4:])
+        add_card(ax3, 'COST SAVINGS', '$840K', 'vs legacy tools')
+
+        # Security Posture Trend
+        ax4 = fig.add_subplot(gs[1, :3])
+        ax4.set_facecolor(COLORS['bg_card'])
+        ax4.set_title('Security Posture Score (90 Days)', fontproperties=FP_TITLE,
+                      color=COLORS['text_primary'], pad=15)
+
+        self.ax_score = ax4
+        self.days = data['days90']
+        score = data['score']
+
+        self.score_line, = ax4.plot(self.days, score, color=COLORS['accent'], linewidth=3, label='Posture Score')
+        self.score_fill = ax4.fill_between(self.days, score, alpha=0.3, color=COLORS['accent'])
+        ax4.axhline(y=70, color=COLORS['warning'], linestyle='--', linewidth=1.5, label='Target', alpha=0.7)
+
+        ax4.set_xlabel('Days', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+        ax4.set_ylabel('Score (0-100)', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+        ax4.legend(loc='lower right', framealpha=0.9, facecolor=COLORS['bg_card_hover'])
+        ax4.grid(True, alpha=0.2, linestyle='--')
+        ax4.spines['top'].set_visible(False)
+        ax4.spines['right'].set_visible(False)
+        ax4.set_ylim(50, 85)
+
+        # Compliance Status
+        ax5 = fig.add_subplot(gs[1, 3:])
+        ax5.set_facecolor(COLORS['bg_card'])
+        ax5.set_title('Compliance Framework Status', fontproperties=FP_TITLE,
+                      color=COLORS['text_primary'], pad=15)
+
+        frameworks = ['SOC 2\nType II', 'HIPAA', 'GDPR', 'PCI DSS', 'ISO\n27001']
+        compliance = [100, 99, 98, 97, 96]
+        colors_comp = np.array([COLORS['warning'], COLORS['accent']])[np.digitize(compliance, [98])]
+
+        bars = ax5.bar(frameworks, compliance, color=colors_comp, alpha=0.8, edgecolor=COLORS['border'], linewidth=1.5, width=0.6)
+
+        for bar, val in zip(bars, compliance):
+            height = bar.get_height()
+            ax5.text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                    f'{val}%', ha='center', va='bottom', fontsize=10, color=COLORS['text_primary'], weight='bold')
+
+        ax5.set_ylabel('Compliance %', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+        ax5.set_ylim(90, 105)
+        ax5.axhline(y=95, color=COLORS['danger'], linestyle='--', linewidth=1.5, alpha=0.5)
+        ax5.grid(axis='y', alpha=0.2, linestyle='--')
+        ax5.spines['top'].set_visible(False)
+        ax5.spines['right'].set_visible(False)
+
+        # Threat Breakdown
+        ax6 = fig.add_subplot(gs[2, :3])
+        ax6.set_facecolor(COLORS['bg_card'])
+        ax6.set_title('Threat Category Breakdown (30 Days)', fontproperties=FP_TITLE,
+                      color=COLORS['text_primary'], pad=15)
+
+        categories = ['Malware', 'Phishing', 'DLP Violations', 'Insider Threat', 'Vuln Exploit', 'Misc']
+        incidents = [34, 28, 47, 12, 8, 6]
+        cat_colors = [COLORS['critical'], COLORS['danger'], COLORS['high'], COLORS['warning'], COLORS['medium'], COLORS['low']]
+
+        add_pie(ax6, incidents, categories, cat_colors, '%1.0f%%', fontsize=9)
+
+        # ROI Metrics
+        ax7 = fig.add_subplot(gs[2, 3:])
+        ax7.set_facecolor(COLORS['bg_card'])
+        ax7.set_title('Return on Investment (Year 1)', fontproperties=FP_TITLE,
+                      color=COLORS['text_primary'], pad=15)
+
+        roi_cats = ['Tool\nConsolidation', 'Reduced\nHeadcount', 'Prevented\nBreaches', 'Compliance\nEfficiency']
+        savings = [800, 200, 105, 90]
+
+        bars2 = ax7.bar(roi_cats, savings, color=COLORS['accent'], alpha=0.8, edgecolor=COLORS['border'], linewidth=1.5, width=0.6)
+
+        for bar, val in zip(bars2, savings):
+            height = bar.get_height()
+            ax7.text(bar.get_x() + bar.get_width()/2., height + 15,
+                    f'${val}K', ha='center', va='bottom', fontsize=10, color=COLORS['text_primary'], weight='bold')
+
+        ax7.set_ylabel('Savings ($K)', fontproperties=FP_LABEL, color=COLORS['text_secondary'])
+        ax7.grid(axis='y', alpha=0.2, linestyle='--')
+        ax7.spines['top'].set_visible(False)
+        ax7.spines['right'].set_visible(False)
+
+        # Risk Summary
+        panel = add_text_panel(fig, gs[3, :], 'Risk Summary & Recommendations')
+
+        risks = [
+            ('✅', 'SOC Team Fully Operational', f'{COLORS["accent"]} All 6 analysts trained on Privé platform', COLORS['accent']),
+            ('⚠️', 'Phishing Incidents +12% This Month', f'{COLORS["warning"]} Recommend additional user training', COLORS['warning']),
+            ('✅', 'Zero Critical Vulnerabilities', f'{COLORS["accent"]} All endpoints patched within 48hrs', COLORS['accent']),
+            ('⚠️', 'DLP Policy Coverage at 87%', f'{COLORS["warning"]} 13% of endpoints need policy updates', COLORS['warning']),
+            ('✅', '$840K Annual Cost Savings Achieved', f'{COLORS["accent"]} ROI realized in 4.2 months', COLORS['accent']),
+        ]
+
+        title_style = dict(fontsize=11, color=COLORS['text_primary'], weight='bold', va='center', transform=panel)
+        rows_y = 0.88 - 0.18 * np.arange(len(risks))
+        for y_pos, (icon, title, subtitle, color) in zip(rows_y, risks):
+            fig.text(0.02, y_pos, icon, fontsize=16, va='center', transform=panel)
+            fig.text(0.06, y_pos+0.02, title, **title_style)
+            fig.text(0.06, y_pos-0.05, subtitle, fontsize=9, color=color, va='center', transform=panel)
+
+    def update(self, data):
+        """Replace the posture score line and fill with a new dataset's"""
+        self.days = data['days90']
+        self.score_line.set_data(self.days, data['score'])
+        self.score_fill.remove()
+        self.score_fill = self.ax_score.fill_between(self.days, data['score'], alpha=0.3, color=COLORS['accent'])
+        # The day range may differ from the first dataset; y stays fixed
+        self.ax_score.relim()
+        self.ax_score.autoscale_view(scaley=False)
+
+    def render(self, data=None):
+        """Save the dashboard, updating the posture score first if given data"""
+        if data is not None:
+            self.update(data)
+        save_dashboard(self.fig, 'executive')
+
+_EXECUTIVE = None
+
+def generate_executive_dashboard(data):
+    """Generate Executive Dashboard, reusing its artists on repeat calls"""
+    global _EXECUTIVE
+    if _EXECUTIVE is None:
+        # A fresh instance already plots this data; only later calls update
+        _EXECUTIVE = ExecutiveDashboard(data)
+        _EXECUTIVE.render()
+    else:
+        _EXECUTIVE.render(data)
+
+GENERATORS = {
+    'soc': generate_soc_dashboard,
+    'hunting': generate_threat_hunting_dashboard,
+    'dlp': generate_dlp_dashboard,
+    'executive': generate_executive_dashboard,
+}
 
-    plt.savefig('docs/images/dashboard-executive.png', dpi=150, bbox_inches='tight', facecolor=COLORS['bg_dark'])
-    print("✅ Generated: dashboard-executive.png")
-    plt.close()
+def _run(name, data):
+    """Render one dashboard inside a pool worker"""
+    GENERATORS[name](data)
 
 if __name__ == '__main__':
     print("🎨 Generating professional dashboard mockups...")
     print("")
 
-    generate_soc_dashboard()
-    generate_threat_hunting_dashboard()
-    generate_dlp_dashboard()
-    generate_executive_dashboard()
+    data = build_dataset(np.random.default_rng(SEED))
+
+    # The dashboards are independent, so render them in parallel
+    with multiprocessing.Pool(len(GENERATORS)) as pool:
+        pool.starmap(_run, [(name, data) for name in GENERATORS])
 
     print("")
     print("✅ All dashboards generated successfully!")